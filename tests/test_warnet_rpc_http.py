@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Test: Direct JSON-RPC transport in warnet_test_framework
+
+Runs WarnetRPC's HTTP path against a stub bitcoind on localhost to check
+batch ordering, error propagation, retries and the CLI fallback.
+"""
+
+import json
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from warnet_test_framework import WarnetRPC
+
+
+class StubBitcoind(BaseHTTPRequestHandler):
+    """Answers JSON-RPC like bitcoind; behaviour is set on the server object"""
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        server = self.server
+        server.requests.append(json.loads(self.rfile.read(int(self.headers['Content-Length']))))
+        server.auth.append(self.headers['Authorization'])
+        if server.drop_next > 0:
+            # Hang up without answering, like a bitcoind that is restarting
+            server.drop_next -= 1
+            self.close_connection = True
+            return
+
+        request = server.requests[-1]
+        if isinstance(request, list):
+            responses = [server.answer(r) for r in request]
+            if server.reverse_batch:
+                responses.reverse()
+            status = 200
+        else:
+            responses = server.answer(request)
+            status = 500 if responses['error'] else 200
+        body = json.dumps(responses).encode()
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _answer(request):
+    method, params = request['method'], request['params']
+    if method == 'fail':
+        return {'id': request['id'], 'result': None, 'error': {'code': -32601, 'message': 'Method not found'}}
+    if method == 'getblockhash':
+        return {'id': request['id'], 'result': f"hash-{params[0]}", 'error': None}
+    return {'id': request['id'], 'result': {'method': method, 'params': params}, 'error': None}
+
+
+@pytest.fixture
+def stub():
+    """Stub bitcoind registered as the only direct-RPC node, 'tank-0000'"""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubBitcoind)
+    server.requests, server.auth = [], []
+    server.drop_next, server.reverse_batch = 0, False
+    server.answer = _answer
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    WarnetRPC.use_direct_rpc({'tank-0000': '127.0.0.1'}, 'alice', 'secret', port=server.server_address[1])
+    yield server
+
+    for conns in WarnetRPC._http_pool.values():
+        for conn in conns:
+            conn.close()
+    WarnetRPC._http_pool.clear()
+    WarnetRPC._http_endpoints = {}
+    server.shutdown()
+    server.server_close()
+
+
+def test_single_call_types_params_and_authenticates(stub):
+    """A call goes over HTTP with CLI-style args typed as JSON and basic auth"""
+    assert WarnetRPC.call('tank-0000', 'getblockhash', '10') == 'hash-10'
+    assert stub.requests[0]['params'] == [10]
+    assert stub.auth[0] == 'Basic YWxpY2U6c2VjcmV0'
+
+
+def test_batch_results_follow_call_order(stub):
+    """JSON-RPC batch responses may come back in any order; results follow the calls"""
+    stub.reverse_batch = True
+    calls = [('getblockhash', str(h)) for h in range(5)]
+    assert WarnetRPC.batch('tank-0000', calls) == [f"hash-{h}" for h in range(5)]
+    assert len(stub.requests) == 1 and len(stub.requests[0]) == 5
+
+
+def test_rpc_error_is_reported_per_call(stub):
+    """An RPC error yields {} for that call only, as the CLI path does"""
+    results = WarnetRPC.batch('tank-0000', [('getblockhash', '1'), ('fail',), ('getblockhash', '2')])
+    assert results == ['hash-1', {}, 'hash-2']
+    # A lone failing call comes back as HTTP 500 with a JSON body, not a transport error
+    assert WarnetRPC.call('tank-0000', 'fail') == {}
+    assert 'tank-0000' in WarnetRPC._http_endpoints
+
+
+def test_dropped_connection_is_retried(stub):
+    """A transport failure is retried on a fresh connection"""
+    stub.drop_next = 2
+    assert WarnetRPC.call('tank-0000', 'getblockhash', '7') == 'hash-7'
+    assert len(stub.requests) == 3
+
+
+def test_unreachable_node_falls_back_to_cli(stub, monkeypatch):
+    """After every retry fails, the call goes through the CLI and the endpoint is dropped"""
+    cli_calls = []
+    monkeypatch.setattr(WarnetRPC, '_call_cli',
+                        staticmethod(lambda node, *rpc, **kwargs: cli_calls.append((node,) + rpc) or 'cli'))
+    stub.drop_next = 3
+    assert WarnetRPC.call('tank-0000', 'getblockcount') == 'cli'
+    assert cli_calls == [('tank-0000', 'getblockcount')]
+    assert 'tank-0000' not in WarnetRPC._http_endpoints
+
+    # Later calls skip HTTP entirely
+    WarnetRPC.call('tank-0000', 'getblockcount')
+    assert len(stub.requests) == 3
+
+
+def test_fallback_while_other_calls_are_in_flight(stub, monkeypatch):
+    """Calls racing a fallback on the same node end up on the CLI instead of raising"""
+    monkeypatch.setattr(WarnetRPC, '_call_cli', staticmethod(lambda node, *rpc, **kwargs: 'cli'))
+    stub.drop_next = 1000
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        results = list(executor.map(lambda _: WarnetRPC.call('tank-0000', 'getblockcount'), range(64)))
+    assert results == ['cli'] * 64
+
+    # Same race, made deterministic: the endpoint is dropped between two retries
+    WarnetRPC.use_direct_rpc({'tank-0000': '127.0.0.1'}, 'alice', 'secret', port=stub.server_address[1])
+    real_post = WarnetRPC._http_post
+
+    def post_then_drop(node, endpoint, payload):
+        WarnetRPC._http_endpoints.pop(node)
+        return real_post(node, endpoint, payload)
+
+    monkeypatch.setattr(WarnetRPC, '_http_post', staticmethod(post_then_drop))
+    assert WarnetRPC.call('tank-0000', 'getblockcount') == 'cli'
@@ -15,6 +15,12 @@ Usage:
     # Export to specific format
     python 4_analyze_results.py --input sweep_output/results --export csv
 
+    # Bulk CSV export only (skips threshold/correlation analysis)
+    python 4_analyze_results.py --input sweep_output/results --export csv --no-report
+
+    # Cache parsed scenario rows so re-runs only parse changed scenarios
+    python 4_analyze_results.py --input sweep_output/results --cache
+
 Output:
     results/
     ├── analysis/
@@ -22,18 +28,205 @@ Output:
     │   ├── thresholds.json        # Critical threshold analysis
     │   ├── correlations.json      # Parameter correlations
     │   ├── sweep_data.csv         # Full dataset
+    │   ├── results_cache.json     # Parsed scenario rows (only with --cache)
     │   └── figures/               # Visualizations (if --visualize)
     └── ...
 """
 
 import argparse
 import csv
+import heapq
 import json
 import os
 import sys
 from pathlib import Path
-from typing import Dict, List, Any, Tuple, Optional
+from stat import S_ISREG
+from typing import Callable, Dict, List, Any, Tuple, Optional
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+# results.json files at least this large are streamed with ijson (if installed)
+# instead of being fully decoded; below it a full orjson/json decode is faster
+STREAM_PARSE_MIN_BYTES = 8 * 1024 * 1024
+
+# Leaf fields read from results.json, as ijson dotted prefixes
+RESULT_FIELDS = {
+    "metadata.duration_seconds",
+    "summary.blocks_mined.v27", "summary.blocks_mined.v26", "summary.total_blocks",
+    "summary.final_hashrate.v27", "summary.final_hashrate.v26",
+    "summary.final_economic.v27", "summary.final_economic.v26",
+    "summary.final_prices.v27", "summary.final_prices.v26",
+    "reorg.network_summary.total_reorg_events",
+    "reorg.network_summary.total_blocks_orphaned",
+    "reorg.network_summary.total_reorg_mass",
+    "difficulty.winning_fork",
+}
+
+# Per-node fields read from the economic node / pool maps (keyed by node name)
+RESULT_NODE_FIELDS = {
+    "economic.nodes": ("profile.custody_btc", "current_allocation"),
+    "pools.pools": ("costs.cumulative_opportunity_cost_usd", "current_allocation"),
+}
+
+# Fork outcome categories; a category's index is its id in the column store
+OUTCOMES = ["v27_dominant", "contested", "v26_dominant"]
+OUTCOME_IDS = {outcome: i for i, outcome in enumerate(OUTCOMES)}
+
+OUTCOME_COLORS = {"v27_dominant": "#2ecc71", "contested": "#f1c40f", "v26_dominant": "#e74c3c"}
+
+# v27 hashrate share above/below which a fork counts as v27/v26 dominant
+V27_DOMINANT_SHARE = 0.65
+V26_DOMINANT_SHARE = 0.35
+
+# Parameters analyzed for outcome thresholds
+THRESHOLD_PARAMS = [
+    "economic_split", "hashrate_split",
+    "pool_ideology_strength", "pool_profitability_threshold", "pool_max_loss_pct",
+    "pool_committed_split", "pool_neutral_pct",
+    "econ_ideology_strength", "econ_switching_threshold",
+    "user_ideology_strength", "transaction_velocity"
+]
+
+# Numeric parameters and outcomes used for correlations
+CORRELATION_PARAMS = [
+    "economic_split", "hashrate_split",
+    "pool_ideology_strength", "pool_profitability_threshold", "pool_max_loss_pct",
+    "econ_ideology_strength", "user_ideology_strength", "transaction_velocity"
+]
+
+CORRELATION_METRICS = [
+    "v27_hash_share", "v27_econ_share", "v27_block_share", "total_reorgs",
+    "econ_final", "econ_delta", "econ_switch_time_s", "peak_price_gap_pct", "cascade_time_s",
+]
+
+# Every numeric field the analyses read, in column-store order
+ANALYSIS_COLUMNS = list(dict.fromkeys(THRESHOLD_PARAMS + CORRELATION_PARAMS + CORRELATION_METRICS))
+
+# Errors raised when a results.json cannot be read or decoded
+RESULTS_READ_ERRORS = (OSError, ValueError) + ((ijson.JSONError,) if ijson is not None else ())
+
+# Bump when extract_scenario_row/analyze_econ_trajectory change their output
+RESULTS_CACHE_VERSION = 1
+
+_SCALAR_EVENTS = {"null", "boolean", "integer", "double", "number", "string"}
+
+
+# fastmath without "nnan"/"ninf": the kernels rely on NaN checks for missing values
+NUMBA_FASTMATH = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+_pearson = None
+if njit is not None:
+    @njit(cache=True, nogil=True, fastmath=NUMBA_FASTMATH)
+    def _pearson(x, y):
+        """Fused single-pass Pearson over rows where both x and y are present"""
+        n = 0
+        sx = sy = sxx = syy = sxy = 0.0
+        for k in range(x.shape[0]):
+            a = x[k]
+            b = y[k]
+            if np.isnan(a) or np.isnan(b):
+                continue
+            n += 1
+            sx += a
+            sy += b
+            sxx += a * a
+            syy += b * b
+            sxy += a * b
+        if n == 0:
+            return 0, np.nan
+        mean_x = sx / n
+        mean_y = sy / n
+        var_x = sxx / n - mean_x * mean_x
+        var_y = syy / n - mean_y * mean_y
+        if var_x <= 0.0 or var_y <= 0.0:
+            return n, np.nan
+        return n, (sxy / n - mean_x * mean_y) / np.sqrt(var_x * var_y)
+
+
+_groupby_stats = None
+if njit is not None:
+    @njit(cache=True, nogil=True)
+    def _groupby_stats(values, group_ids, n_groups):
+        """Single pass over rows updating per-(group, column) count/sum/min/max"""
+        n_rows, n_cols = values.shape
+        counts = np.zeros((n_groups, n_cols), dtype=np.int64)
+        sums = np.zeros((n_groups, n_cols))
+        mins = np.full((n_groups, n_cols), np.inf)
+        maxs = np.full((n_groups, n_cols), -np.inf)
+        for i in range(n_rows):
+            g = group_ids[i]
+            for j in range(n_cols):
+                v = values[i, j]
+                if np.isnan(v):
+                    continue
+                counts[g, j] += 1
+                sums[g, j] += v
+                if v < mins[g, j]:
+                    mins[g, j] = v
+                if v > maxs[g, j]:
+                    maxs[g, j] = v
+        return counts, sums, mins, maxs
+
+
+def _set_path(data: Dict, keys: List[str], value: Any):
+    """Set data[k0][k1]...[kn] = value, creating intermediate dicts"""
+    for key in keys[:-1]:
+        data = data.setdefault(key, {})
+    data[keys[-1]] = value
+
+
+def stream_results_fields(results_file: Path) -> Dict:
+    """Stream results.json with ijson, building only the fields the analysis reads.
+
+    Returns a pruned dict with the same nesting as the full document, so it
+    can be consumed exactly like the output of json.load.
+    """
+    data: Dict = {}
+    with open(results_file, "rb") as f:
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if event not in _SCALAR_EVENTS:
+                continue
+            if prefix in RESULT_FIELDS:
+                _set_path(data, prefix.split("."), value)
+                continue
+            for root, fields in RESULT_NODE_FIELDS.items():
+                if not prefix.startswith(root + "."):
+                    continue
+                rest = prefix[len(root) + 1:]
+                for field in fields:
+                    if rest.endswith("." + field):
+                        node = rest[:-len(field) - 1]
+                        _set_path(data, root.split(".") + [node] + field.split("."), value)
+                        break
+    return data
+
+
+def read_results_json(results_file: Path) -> Dict:
+    """Load a scenario's results.json, streaming large files when possible"""
+    if ijson is not None and results_file.stat().st_size >= STREAM_PARSE_MIN_BYTES:
+        return stream_results_fields(results_file)
+    if orjson is not None:
+        return orjson.loads(results_file.read_bytes())
+    with open(results_file) as f:
+        return json.load(f)
 
 
 def load_time_series(scenario_dir: Path) -> List[Dict]:
@@ -119,113 +312,185 @@ def analyze_econ_trajectory(ts_rows: List[Dict]) -> Dict:
     }
 
 
-def load_scenario_results(results_dir: Path) -> List[Dict]:
-    """Load all scenario results into a list"""
+def extract_scenario_row(scenario_id: str, data: Dict) -> Dict:
+    """Extract the analysis row from a parsed results.json document.
+
+    Specialized for the results.json layout written by the sweep: each nested
+    section is looked up once and the row is built in a single dict display.
+    """
+    metadata = data.get("metadata", {})
+    summary = data.get("summary", {})
+    blocks = summary.get("blocks_mined", {})
+    hashrate = summary.get("final_hashrate", {})
+    economic = summary.get("final_economic", {})
+    prices = summary.get("final_prices", {})
+    reorg = data.get("reorg", {}).get("network_summary", {})
+
+    v27_blocks = blocks.get("v27", 0)
+    v26_blocks = blocks.get("v26", 0)
+    v27_hashrate = hashrate.get("v27", 50)
+    v26_hashrate = hashrate.get("v26", 50)
+    v27_economic = economic.get("v27", 50)
+    v26_economic = economic.get("v26", 50)
+    v27_price = prices.get("v27", 0)
+    v26_price = prices.get("v26", 0)
+
+    # Derived shares
+    total_hash = v27_hashrate + v26_hashrate
+    v27_hash_share = v27_hashrate / total_hash if total_hash > 0 else 0.5
+    total_econ = v27_economic + v26_economic
+    total_blocks = v27_blocks + v26_blocks
+
+    # Determine outcome category
+    if v27_hash_share > V27_DOMINANT_SHARE:
+        outcome = "v27_dominant"
+    elif v27_hash_share < V26_DOMINANT_SHARE:
+        outcome = "v26_dominant"
+    else:
+        outcome = "contested"
+
+    # Fork valuation: sum custody_btc per fork × final price
+    v27_custody = 0
+    v26_custody = 0
+    for node_data in data.get("economic", {}).get("nodes", {}).values():
+        allocation = node_data.get("current_allocation", "")
+        if allocation == "v27":
+            v27_custody += node_data.get("profile", {}).get("custody_btc", 0)
+        elif allocation == "v26":
+            v26_custody += node_data.get("profile", {}).get("custody_btc", 0)
+
+    # Total pool opportunity cost per fork
+    v27_pool_cost = 0
+    v26_pool_cost = 0
+    for pool_data in data.get("pools", {}).get("pools", {}).values():
+        allocation = pool_data.get("current_allocation", "")
+        if allocation == "v27":
+            v27_pool_cost += pool_data.get("costs", {}).get("cumulative_opportunity_cost_usd", 0) or 0
+        elif allocation == "v26":
+            v26_pool_cost += pool_data.get("costs", {}).get("cumulative_opportunity_cost_usd", 0) or 0
+
+    return {
+        "scenario_id": scenario_id,
+        "duration": metadata.get("duration_seconds", 0),
+        "v27_blocks": v27_blocks,
+        "v26_blocks": v26_blocks,
+        "total_blocks": summary.get("total_blocks", 0),
+        "final_v27_hashrate": v27_hashrate,
+        "final_v26_hashrate": v26_hashrate,
+        "final_v27_economic": v27_economic,
+        "final_v26_economic": v26_economic,
+        "final_v27_price": v27_price,
+        "final_v26_price": v26_price,
+        "total_reorgs": reorg.get("total_reorg_events", 0),
+        "total_orphans": reorg.get("total_blocks_orphaned", 0),
+        "reorg_mass": reorg.get("total_reorg_mass", 0),
+        "winning_fork": data.get("difficulty", {}).get("winning_fork", "unknown"),
+        "v27_hash_share": v27_hash_share,
+        "v27_econ_share": v27_economic / total_econ if total_econ > 0 else 0.5,
+        "v27_block_share": v27_blocks / total_blocks if total_blocks > 0 else 0.5,
+        "outcome": outcome,
+        "v27_fork_valuation": v27_custody * v27_price,
+        "v26_fork_valuation": v26_custody * v26_price,
+        "v27_pool_opportunity_cost": v27_pool_cost,
+        "v26_pool_opportunity_cost": v26_pool_cost,
+    }
+
+
+def scenario_signature(scenario_dir: str) -> List:
+    """(mtime_ns, size) of a scenario's result files, None for missing files"""
+    signature = []
+    for name in ("results.json", "time_series.csv"):
+        try:
+            st = os.stat(os.path.join(scenario_dir, name))
+        except OSError:
+            signature.append(None)
+            continue
+        signature.append([st.st_mtime_ns, st.st_size] if S_ISREG(st.st_mode) else None)
+    return signature
+
+
+def load_results_cache(cache_path: Path) -> Dict[str, Dict]:
+    """Load cached scenario rows; returns {} if missing, unreadable or stale"""
+    try:
+        if orjson is not None:
+            cache = orjson.loads(cache_path.read_bytes())
+        else:
+            with open(cache_path) as f:
+                cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get("version") != RESULTS_CACHE_VERSION:
+        return {}
+    return cache.get("scenarios", {})
+
+
+def save_results_cache(cache_path: Path, scenarios: Dict[str, Dict]):
+    """Atomically write the scenario row cache"""
+    cache = {"version": RESULTS_CACHE_VERSION, "scenarios": scenarios}
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    if orjson is not None:
+        tmp_path.write_bytes(orjson.dumps(cache))
+    else:
+        with open(tmp_path, "w") as f:
+            json.dump(cache, f)
+    os.replace(tmp_path, cache_path)
+
+
+def load_scenario_results(results_dir: Path, cache_path: Optional[Path] = None) -> List[Dict]:
+    """Load all scenario results into a list.
+
+    With cache_path, rows are reused from the cache for scenarios whose result
+    files are unchanged since the last run; only new or modified scenarios are
+    parsed, and the cache is then rewritten.
+    """
     results = []
+    cached = load_results_cache(cache_path) if cache_path else {}
+    entries = {}
+
+    # DirEntry.is_dir() uses the d_type from readdir, so no stat per entry
+    with os.scandir(results_dir) as it:
+        scenario_entries = sorted(
+            (entry for entry in it if entry.name != "analysis" and entry.is_dir()),
+            key=lambda entry: entry.name
+        )
 
-    for scenario_dir in sorted(results_dir.iterdir()):
-        if not scenario_dir.is_dir():
+    for entry in scenario_entries:
+        # The signature stat doubles as the results.json existence check
+        signature = scenario_signature(entry.path)
+        if signature[0] is None:
             continue
-        if scenario_dir.name == "analysis":
+
+        cached_entry = cached.get(entry.name)
+        if cached_entry is not None and cached_entry["signature"] == signature:
+            entries[entry.name] = cached_entry
+            results.append(cached_entry["row"])
             continue
 
+        scenario_dir = Path(entry.path)
         results_file = scenario_dir / "results.json"
-        if not results_file.exists():
-            continue
 
+        # Only decoding can fail on a well-formed sweep (e.g. a results.json
+        # still being written); extraction errors mean a schema change and
+        # are not swallowed
         try:
-            with open(results_file) as f:
-                data = json.load(f)
-
-            # Extract key metrics
-            row = {"scenario_id": scenario_dir.name}
-
-            # Metadata/parameters
-            metadata = data.get("metadata", {})
-            row["duration"] = metadata.get("duration_seconds", 0)
-
-            # Summary metrics
-            summary = data.get("summary", {})
-            row["v27_blocks"] = summary.get("blocks_mined", {}).get("v27", 0)
-            row["v26_blocks"] = summary.get("blocks_mined", {}).get("v26", 0)
-            row["total_blocks"] = summary.get("total_blocks", 0)
-
-            row["final_v27_hashrate"] = summary.get("final_hashrate", {}).get("v27", 50)
-            row["final_v26_hashrate"] = summary.get("final_hashrate", {}).get("v26", 50)
-            row["final_v27_economic"] = summary.get("final_economic", {}).get("v27", 50)
-            row["final_v26_economic"] = summary.get("final_economic", {}).get("v26", 50)
-
-            # Price metrics
-            row["final_v27_price"] = summary.get("final_prices", {}).get("v27", 0)
-            row["final_v26_price"] = summary.get("final_prices", {}).get("v26", 0)
-
-            # Reorg metrics
-            reorg = data.get("reorg", {}).get("network_summary", {})
-            row["total_reorgs"] = reorg.get("total_reorg_events", 0)
-            row["total_orphans"] = reorg.get("total_blocks_orphaned", 0)
-            row["reorg_mass"] = reorg.get("total_reorg_mass", 0)
-
-            # Difficulty metrics
-            difficulty = data.get("difficulty", {})
-            row["winning_fork"] = difficulty.get("winning_fork", "unknown")
-
-            # Calculate derived metrics
-            total_hash = row["final_v27_hashrate"] + row["final_v26_hashrate"]
-            row["v27_hash_share"] = row["final_v27_hashrate"] / total_hash if total_hash > 0 else 0.5
-
-            total_econ = row["final_v27_economic"] + row["final_v26_economic"]
-            row["v27_econ_share"] = row["final_v27_economic"] / total_econ if total_econ > 0 else 0.5
-
-            total_blocks = row["v27_blocks"] + row["v26_blocks"]
-            row["v27_block_share"] = row["v27_blocks"] / total_blocks if total_blocks > 0 else 0.5
-
-            # Determine outcome category
-            if row["v27_hash_share"] > 0.65:
-                row["outcome"] = "v27_dominant"
-            elif row["v27_hash_share"] < 0.35:
-                row["outcome"] = "v26_dominant"
-            else:
-                row["outcome"] = "contested"
-
-            # Fork valuation: sum custody_btc per fork × final price
-            v27_custody = 0
-            v26_custody = 0
-            economic_nodes = data.get("economic", {}).get("nodes", {})
-            for node_data in economic_nodes.values():
-                profile = node_data.get("profile", {})
-                allocation = node_data.get("current_allocation", "")
-                custody = profile.get("custody_btc", 0)
-                if allocation == "v27":
-                    v27_custody += custody
-                elif allocation == "v26":
-                    v26_custody += custody
-            row["v27_fork_valuation"] = v27_custody * row["final_v27_price"]
-            row["v26_fork_valuation"] = v26_custody * row["final_v26_price"]
-
-            # Total pool opportunity cost per fork
-            v27_pool_cost = 0
-            v26_pool_cost = 0
-            pool_nodes = data.get("pools", {}).get("pools", {})
-            for pool_data in pool_nodes.values():
-                costs = pool_data.get("costs", {})
-                allocation = pool_data.get("current_allocation", "")
-                opp_cost = costs.get("cumulative_opportunity_cost_usd", 0) or 0
-                if allocation == "v27":
-                    v27_pool_cost += opp_cost
-                elif allocation == "v26":
-                    v26_pool_cost += opp_cost
-            row["v27_pool_opportunity_cost"] = v27_pool_cost
-            row["v26_pool_opportunity_cost"] = v26_pool_cost
-
-            # Econ trajectory from time series
-            ts_rows = load_time_series(scenario_dir)
-            traj = analyze_econ_trajectory(ts_rows)
-            row.update(traj)
-
-            results.append(row)
-
-        except Exception as e:
-            print(f"  Warning: Failed to load {scenario_dir.name}: {e}")
+            data = read_results_json(results_file)
+        except RESULTS_READ_ERRORS as e:
+            print(f"  Warning: Failed to load {entry.name}: {e}")
+            continue
+
+        row = extract_scenario_row(entry.name, data)
+
+        # Econ trajectory from time series
+        ts_rows = load_time_series(scenario_dir) if signature[1] is not None else []
+        traj = analyze_econ_trajectory(ts_rows)
+        row.update(traj)
+
+        entries[entry.name] = {"signature": signature, "row": row}
+        results.append(row)
+
+    if cache_path and entries:
+        save_results_cache(cache_path, entries)
 
     return results
 
@@ -242,74 +507,114 @@ def load_parameters(manifest_path: Path) -> Dict[str, Dict]:
 
 
 def merge_results_with_params(results: List[Dict], params: Dict[str, Dict]) -> List[Dict]:
-    """Merge results with input parameters"""
-    merged = []
+    """Merge input parameters into the result rows.
+
+    Rows are updated in place (result values take precedence over parameters
+    of the same name), so no per-scenario dict copies are made.
+    """
     for r in results:
-        scenario_id = r["scenario_id"]
-        if scenario_id in params:
-            merged_row = {**params[scenario_id], **r}
-        else:
-            merged_row = r
-        merged.append(merged_row)
-    return merged
+        scenario_params = params.get(r["scenario_id"])
+        if scenario_params:
+            for key, value in scenario_params.items():
+                r.setdefault(key, value)
+    return results
 
 
-def calculate_outcome_statistics(results: List[Dict]) -> Dict:
+def calculate_outcome_statistics(columns: Dict[str, np.ndarray]) -> Dict:
     """Calculate statistics by outcome category"""
-    outcomes = defaultdict(list)
-
-    for r in results:
-        outcomes[r["outcome"]].append(r)
+    total = len(columns["outcome_id"])
+    counts = np.bincount(columns["outcome_id"], minlength=len(OUTCOMES))
 
     stats = {}
-    for outcome, rows in outcomes.items():
-        stats[outcome] = {
-            "count": len(rows),
-            "percentage": round(len(rows) / len(results) * 100, 1) if results else 0
-        }
+    for outcome, count in zip(OUTCOMES, counts.tolist()):
+        if count:
+            stats[outcome] = {
+                "count": count,
+                "percentage": round(count / total * 100, 1)
+            }
 
     return stats
 
 
-def find_critical_thresholds(results: List[Dict], params: Dict[str, Dict]) -> Dict:
-    """Identify parameter thresholds that predict outcomes"""
-    merged = merge_results_with_params(results, params)
+def first_present(values: np.ndarray) -> np.ndarray:
+    """First non-NaN value of each column (NaN for all-missing columns)"""
+    rows = np.argmax(~np.isnan(values), axis=0)
+    return values[rows, np.arange(values.shape[1])]
 
-    if not merged:
-        return {}
 
-    # Parameters to analyze
-    param_names = [
-        "economic_split", "hashrate_split",
-        "pool_ideology_strength", "pool_profitability_threshold", "pool_max_loss_pct",
-        "pool_committed_split", "pool_neutral_pct",
-        "econ_ideology_strength", "econ_switching_threshold",
-        "user_ideology_strength", "transaction_velocity"
-    ]
+def classify_outcomes(v27_hash_share: np.ndarray) -> np.ndarray:
+    """Vectorized outcome category ids (see OUTCOMES) from v27 hashrate share"""
+    return np.where(
+        v27_hash_share > V27_DOMINANT_SHARE, OUTCOME_IDS["v27_dominant"],
+        np.where(v27_hash_share < V26_DOMINANT_SHARE, OUTCOME_IDS["v26_dominant"],
+                 OUTCOME_IDS["contested"])
+    ).astype(np.int8)
 
-    thresholds = {}
 
-    for param in param_names:
-        # Get values for each outcome
-        by_outcome = defaultdict(list)
-        for row in merged:
-            if param in row:
-                by_outcome[row["outcome"]].append(row[param])
+def build_column_store(merged: List[Dict]) -> Dict[str, np.ndarray]:
+    """Convert merged rows into one float column (NaN where missing) per analyzed
+    field, plus outcome ids. Built once and shared by all analyses."""
+    columns = {}
+    for name in ANALYSIS_COLUMNS:
+        values = (row.get(name) for row in merged)
+        columns[name] = np.fromiter(
+            (v if isinstance(v, (int, float)) else np.nan for v in values),
+            dtype=float, count=len(merged)
+        )
+    columns["outcome_id"] = classify_outcomes(columns["v27_hash_share"])
+    return columns
+
+
+def groupby_stats(values: np.ndarray, group_ids: np.ndarray,
+                  n_groups: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Per-group count/sum/min/max of every column, ignoring NaN.
+
+    Accumulates straight into (n_groups, n_columns) arrays indexed by group id,
+    so no per-group row subsets are built.
+    """
+    if _groupby_stats is not None:
+        return _groupby_stats(np.ascontiguousarray(values), group_ids, n_groups)
+
+    present = ~np.isnan(values)
+    shape = (n_groups, values.shape[1])
+    counts = np.zeros(shape, dtype=np.int64)
+    sums = np.zeros(shape)
+    mins = np.full(shape, np.inf)
+    maxs = np.full(shape, -np.inf)
+    np.add.at(counts, group_ids, present)
+    np.add.at(sums, group_ids, np.where(present, values, 0.0))
+    np.minimum.at(mins, group_ids, np.where(present, values, np.inf))
+    np.maximum.at(maxs, group_ids, np.where(present, values, -np.inf))
+    return counts, sums, mins, maxs
+
+
+def find_critical_thresholds(columns: Dict[str, np.ndarray]) -> Dict:
+    """Identify parameter thresholds that predict outcomes"""
+    outcome_ids = columns["outcome_id"]
+    if not len(outcome_ids):
+        return {}
+
+    values = np.column_stack([columns[p] for p in THRESHOLD_PARAMS])
+    counts, sums, mins, maxs = groupby_stats(values, outcome_ids, len(OUTCOMES))
 
-        if not by_outcome:
-            continue
+    thresholds = {}
 
+    for j, param in enumerate(THRESHOLD_PARAMS):
         # Calculate statistics for each outcome
         param_stats = {}
-        for outcome, values in by_outcome.items():
-            if values:
+        for g, outcome in enumerate(OUTCOMES):
+            count = int(counts[g, j])
+            if count:
                 param_stats[outcome] = {
-                    "mean": round(sum(values) / len(values), 3),
-                    "min": round(min(values), 3),
-                    "max": round(max(values), 3),
-                    "count": len(values)
+                    "mean": round(float(sums[g, j]) / count, 3),
+                    "min": round(float(mins[g, j]), 3),
+                    "max": round(float(maxs[g, j]), 3),
+                    "count": count
                 }
 
+        if not param_stats:
+            continue
+
         # Identify separation thresholds
         if "v27_dominant" in param_stats and "v26_dominant" in param_stats:
             v27_mean = param_stats["v27_dominant"]["mean"]
@@ -322,69 +627,77 @@ def find_critical_thresholds(results: List[Dict], params: Dict[str, Dict]) -> Di
 
         thresholds[param] = param_stats
 
-    # Sort by separation (most discriminating parameters first)
-    sorted_thresholds = dict(sorted(
-        thresholds.items(),
-        key=lambda x: x[1].get("separation", 0),
-        reverse=True
-    ))
-
-    return sorted_thresholds
-
-
-def calculate_correlations(results: List[Dict], params: Dict[str, Dict]) -> Dict:
+    return thresholds
+
+
+def top_thresholds(thresholds: Dict, k: int) -> List[Tuple[str, Dict]]:
+    """The k most discriminating parameters (largest separation first)"""
+    return heapq.nlargest(k, thresholds.items(), key=lambda x: x[1].get("separation", 0))
+
+
+def pearson_matrix(x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Pairwise-complete Pearson correlation of every x column against every y column.
+
+    NaN marks a missing value; each pair only uses rows where both are present.
+    Returns (n, corr) arrays of shape (x_cols, y_cols); corr is NaN where a
+    column has no variance over the shared rows.
+    """
+    n = np.zeros((x.shape[1], y.shape[1]))
+    corr = np.full((x.shape[1], y.shape[1]), np.nan)
+
+    if _pearson is not None:
+        xt = np.ascontiguousarray(x.T)
+        yt = np.ascontiguousarray(y.T)
+        for i in range(xt.shape[0]):
+            for j in range(yt.shape[0]):
+                n[i, j], corr[i, j] = _pearson(xt[i], yt[j])
+        return n, corr
+
+    # Without numba: the same sums from masked matrix products
+    x_present = ~np.isnan(x)
+    y_present = ~np.isnan(y)
+    x0 = np.where(x_present, x, 0.0)
+    y0 = np.where(y_present, y, 0.0)
+    xm = x_present.astype(float)
+    ym = y_present.astype(float)
+
+    n = xm.T @ ym
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean_x = (x0.T @ ym) / n
+        mean_y = (xm.T @ y0) / n
+        cov = (x0.T @ y0) / n - mean_x * mean_y
+        var_x = ((x0 * x0).T @ ym) / n - mean_x ** 2
+        var_y = (xm.T @ (y0 * y0)) / n - mean_y ** 2
+        defined = (var_x > 0) & (var_y > 0)
+        corr[defined] = cov[defined] / np.sqrt(var_x[defined] * var_y[defined])
+    return n, corr
+
+
+def calculate_correlations(columns: Dict[str, np.ndarray]) -> Dict:
     """Calculate correlations between parameters and outcomes"""
-    merged = merge_results_with_params(results, params)
-
-    if not merged:
+    if not len(columns["outcome_id"]):
         return {}
 
-    # Numeric parameters and outcomes
-    param_names = [
-        "economic_split", "hashrate_split",
-        "pool_ideology_strength", "pool_profitability_threshold", "pool_max_loss_pct",
-        "econ_ideology_strength", "user_ideology_strength", "transaction_velocity"
-    ]
+    x = np.column_stack([columns[p] for p in CORRELATION_PARAMS])
+    y = np.column_stack([columns[m] for m in CORRELATION_METRICS])
 
-    outcome_metrics = [
-        "v27_hash_share", "v27_econ_share", "v27_block_share", "total_reorgs",
-        "econ_final", "econ_delta", "econ_switch_time_s", "peak_price_gap_pct", "cascade_time_s",
-    ]
+    # Shift each column by one of its own values before the single-pass sums;
+    # this keeps them numerically stable and makes constant columns exactly zero
+    x = x - first_present(x)
+    y = y - first_present(y)
+    n, corr = pearson_matrix(x, y)
+    x_missing = np.isnan(x).all(axis=0)
 
     correlations = {}
 
-    for param in param_names:
-        param_corrs = {}
-        param_values = [r.get(param) for r in merged if param in r]
-
-        if not param_values:
+    for i, param in enumerate(CORRELATION_PARAMS):
+        if x_missing[i]:
             continue
 
-        for metric in outcome_metrics:
-            metric_values = [r.get(metric) for r in merged if param in r and metric in r]
-            # Drop rows where either value is None
-            pairs = [(p, m) for p, m in zip(param_values, metric_values) if p is not None and m is not None]
-            if not pairs:
-                continue
-            param_values_m, metric_values = zip(*pairs)
-            param_values_m = list(param_values_m)
-            metric_values = list(metric_values)
-
-            if len(param_values_m) != len(metric_values) or len(param_values_m) < 3:
-                continue
-
-            # Simple correlation calculation (Pearson)
-            n = len(param_values_m)
-            mean_p = sum(param_values_m) / n
-            mean_m = sum(metric_values) / n
-
-            cov = sum((p - mean_p) * (m - mean_m) for p, m in zip(param_values_m, metric_values)) / n
-            std_p = (sum((p - mean_p) ** 2 for p in param_values_m) / n) ** 0.5
-            std_m = (sum((m - mean_m) ** 2 for m in metric_values) / n) ** 0.5
-
-            if std_p > 0 and std_m > 0:
-                corr = cov / (std_p * std_m)
-                param_corrs[metric] = round(corr, 3)
+        param_corrs = {}
+        for j, metric in enumerate(CORRELATION_METRICS):
+            if n[i, j] >= 3 and not np.isnan(corr[i, j]):
+                param_corrs[metric] = round(float(corr[i, j]), 3)
 
         if param_corrs:
             correlations[param] = param_corrs
@@ -392,7 +705,8 @@ def calculate_correlations(results: List[Dict], params: Dict[str, Dict]) -> Dict
     return correlations
 
 
-def generate_summary_report(results: List[Dict], thresholds: Dict, correlations: Dict) -> str:
+def generate_summary_report(results: List[Dict], outcome_stats: Dict, thresholds: Dict,
+                            correlations: Dict) -> str:
     """Generate human-readable summary report"""
     lines = [
         "=" * 70,
@@ -404,7 +718,6 @@ def generate_summary_report(results: List[Dict], thresholds: Dict, correlations:
     ]
 
     # Outcome distribution
-    outcome_stats = calculate_outcome_statistics(results)
     lines.append("OUTCOME DISTRIBUTION:")
     for outcome, stats in sorted(outcome_stats.items()):
         lines.append(f"  {outcome}: {stats['count']} ({stats['percentage']}%)")
@@ -415,7 +728,7 @@ def generate_summary_report(results: List[Dict], thresholds: Dict, correlations:
     lines.append("(Parameters with largest difference between v27/v26 dominant outcomes)")
     lines.append("")
 
-    for i, (param, stats) in enumerate(list(thresholds.items())[:5]):
+    for i, (param, stats) in enumerate(top_thresholds(thresholds, 5)):
         sep = stats.get("separation", 0)
         direction = stats.get("v27_favored_direction", "?")
         threshold = stats.get("threshold_estimate", "?")
@@ -467,10 +780,9 @@ def generate_summary_report(results: List[Dict], thresholds: Dict, correlations:
     lines.append("(Parameters most correlated with v27 hashrate share / econ final)")
     lines.append("")
 
-    hash_corrs = [(p, c.get("v27_hash_share", 0)) for p, c in correlations.items()]
-    hash_corrs.sort(key=lambda x: abs(x[1]), reverse=True)
+    hash_corrs = ((p, c.get("v27_hash_share", 0)) for p, c in correlations.items())
 
-    for param, corr in hash_corrs[:5]:
+    for param, corr in heapq.nlargest(5, hash_corrs, key=lambda x: abs(x[1])):
         direction = "+" if corr > 0 else "-"
         econ_corr = correlations.get(param, {}).get("v27_econ_share", 0)
         econ_dir  = "+" if econ_corr > 0 else "-"
@@ -483,8 +795,7 @@ def generate_summary_report(results: List[Dict], thresholds: Dict, correlations:
 
     # Find strongest predictors
     if thresholds:
-        top_param = list(thresholds.keys())[0]
-        top_stats = thresholds[top_param]
+        top_param, top_stats = top_thresholds(thresholds, 1)[0]
         if "threshold_estimate" in top_stats:
             lines.append(f"  * {top_param} is the strongest predictor of fork outcome")
             lines.append(f"    Threshold around {top_stats['threshold_estimate']}")
@@ -496,10 +807,8 @@ def generate_summary_report(results: List[Dict], thresholds: Dict, correlations:
     return "\n".join(lines)
 
 
-def export_to_csv(results: List[Dict], params: Dict[str, Dict], output_path: Path):
+def export_to_csv(merged: List[Dict], output_path: Path):
     """Export merged results to CSV"""
-    merged = merge_results_with_params(results, params)
-
     if not merged:
         print("No data to export")
         return
@@ -526,18 +835,68 @@ def export_to_csv(results: List[Dict], params: Dict[str, Dict], output_path: Pat
     cols = [c for c in priority_cols if c in all_cols]
     cols += sorted([c for c in all_cols if c not in cols])
 
-    with open(output_path, "w") as f:
-        # Header
-        f.write(",".join(cols) + "\n")
-
-        # Rows
-        for row in merged:
-            values = [str(row.get(c, "")) for c in cols]
-            f.write(",".join(values) + "\n")
+    with open(output_path, "w", newline="") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(cols)
+        writer.writerows([row.get(c, "") for c in cols] for row in merged)
 
     print(f"Exported {len(merged)} rows to {output_path}")
 
 
+def _pyplot():
+    """Import pyplot on the non-interactive Agg backend"""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def plot_outcome_distribution(outcome_stats: Dict, output_path: Path):
+    """Outcome distribution pie chart"""
+    plt = _pyplot()
+    fig, ax = plt.subplots(figsize=(8, 6))
+    labels = list(outcome_stats.keys())
+    sizes = [outcome_stats[k]["count"] for k in labels]
+    ax.pie(sizes, labels=labels, autopct='%1.1f%%',
+           colors=[OUTCOME_COLORS.get(l, "#95a5a6") for l in labels])
+    ax.set_title("Fork Outcome Distribution")
+    plt.savefig(output_path, dpi=150, bbox_inches='tight')
+    plt.close()
+
+
+def plot_parameter_effects(panels: List[Tuple[str, np.ndarray, np.ndarray, np.ndarray]],
+                           output_path: Path):
+    """2x2 grid of v27 hashrate share vs parameter, one (param, x, y, outcome_ids) per panel"""
+    plt = _pyplot()
+    fig, axes = plt.subplots(2, 2, figsize=(12, 10))
+    axes = axes.flatten()
+
+    outcome_colors = np.array([OUTCOME_COLORS[o] for o in OUTCOMES])
+
+    for ax, (param, x, y, outcome_ids) in zip(axes, panels):
+        ax.scatter(x, y, c=outcome_colors[outcome_ids], alpha=0.6, s=30)
+        ax.set_xlabel(param)
+        ax.set_ylabel("v27 Hashrate Share")
+        ax.axhline(y=0.5, color='gray', linestyle='--', alpha=0.5)
+
+    plt.tight_layout()
+    plt.savefig(output_path, dpi=150, bbox_inches='tight')
+    plt.close()
+
+
+def render_figures(jobs: List[Tuple[Callable, tuple]]):
+    """Render independent figures, one worker process per figure"""
+    if len(jobs) == 1:
+        func, func_args = jobs[0]
+        func(*func_args)
+        return
+
+    with ProcessPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)) as pool:
+        futures = [pool.submit(func, *func_args) for func, func_args in jobs]
+        for future in futures:
+            future.result()
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Analyze parameter sweep results",
@@ -551,6 +910,11 @@ def main():
                         help="Export format (default: both)")
     parser.add_argument("--visualize", action="store_true",
                         help="Generate visualizations (requires matplotlib)")
+    parser.add_argument("--no-report", action="store_true",
+                        help="Skip the summary report (report.txt and console output)")
+    parser.add_argument("--cache", action="store_true",
+                        help="Write parsed scenario rows to analysis/results_cache.json and "
+                             "reuse them for unchanged scenarios on later runs")
 
     args = parser.parse_args()
 
@@ -566,7 +930,8 @@ def main():
         manifest_path = results_dir.parent / "build_manifest.json"
 
     print(f"Loading results from {results_dir}...")
-    results = load_scenario_results(results_dir)
+    cache_path = results_dir / "analysis" / "results_cache.json" if args.cache else None
+    results = load_scenario_results(results_dir, cache_path)
     print(f"Loaded {len(results)} scenario results")
 
     if not results:
@@ -577,25 +942,31 @@ def main():
     params = load_parameters(manifest_path)
     print(f"Loaded parameters for {len(params)} scenarios")
 
+    merged = merge_results_with_params(results, params)
+
     # Create analysis directory
     analysis_dir = results_dir / "analysis"
     analysis_dir.mkdir(parents=True, exist_ok=True)
 
-    # Calculate statistics
-    print("\nCalculating statistics...")
-    outcome_stats = calculate_outcome_statistics(results)
-    thresholds = find_critical_thresholds(results, params)
-    correlations = calculate_correlations(results, params)
-
-    # Generate report
-    report = generate_summary_report(results, thresholds, correlations)
-    print("\n" + report)
-
-    # Save report
-    report_path = analysis_dir / "report.txt"
-    with open(report_path, "w") as f:
-        f.write(report)
-    print(f"\nSaved report to {report_path}")
+    # Statistics only feed the report, the JSON export and the figures;
+    # a bare CSV export (--export csv --no-report) skips them entirely
+    if not args.no_report or args.export in ["json", "both"] or args.visualize:
+        print("\nCalculating statistics...")
+        columns = build_column_store(merged)
+        outcome_stats = calculate_outcome_statistics(columns)
+        thresholds = find_critical_thresholds(columns)
+        correlations = calculate_correlations(columns)
+
+    if not args.no_report:
+        # Generate report
+        report = generate_summary_report(results, outcome_stats, thresholds, correlations)
+        print("\n" + report)
+
+        # Save report
+        report_path = analysis_dir / "report.txt"
+        with open(report_path, "w") as f:
+            f.write(report)
+        print(f"\nSaved report to {report_path}")
 
     # Export data
     if args.export in ["json", "both"]:
@@ -608,7 +979,8 @@ def main():
 
         thresholds_path = analysis_dir / "thresholds.json"
         with open(thresholds_path, "w") as f:
-            json.dump(thresholds, f, indent=2)
+            # Most discriminating parameters first
+            json.dump(dict(top_thresholds(thresholds, len(thresholds))), f, indent=2)
 
         correlations_path = analysis_dir / "correlations.json"
         with open(correlations_path, "w") as f:
@@ -618,60 +990,36 @@ def main():
 
     if args.export in ["csv", "both"]:
         csv_path = analysis_dir / "sweep_data.csv"
-        export_to_csv(results, params, csv_path)
+        export_to_csv(merged, csv_path)
 
     # Visualizations
     if args.visualize:
         try:
-            import matplotlib
-            matplotlib.use('Agg')
-            import matplotlib.pyplot as plt
-
+            # Imported before the worker pool starts so forked workers inherit it
+            _pyplot()
+        except ImportError:
+            print("Warning: matplotlib not available, skipping visualizations")
+        else:
             figures_dir = analysis_dir / "figures"
             figures_dir.mkdir(exist_ok=True)
 
-            merged = merge_results_with_params(results, params)
-
-            # Outcome distribution pie chart
-            fig, ax = plt.subplots(figsize=(8, 6))
-            labels = list(outcome_stats.keys())
-            sizes = [outcome_stats[k]["count"] for k in labels]
-            colors = {"v27_dominant": "#2ecc71", "contested": "#f1c40f", "v26_dominant": "#e74c3c"}
-            ax.pie(sizes, labels=labels, autopct='%1.1f%%',
-                   colors=[colors.get(l, "#95a5a6") for l in labels])
-            ax.set_title("Fork Outcome Distribution")
-            plt.savefig(figures_dir / "outcome_distribution.png", dpi=150, bbox_inches='tight')
-            plt.close()
+            jobs = [(plot_outcome_distribution,
+                     (outcome_stats, figures_dir / "outcome_distribution.png"))]
 
             # Top parameter scatter plots
             if thresholds:
-                top_params = list(thresholds.keys())[:4]
-
-                fig, axes = plt.subplots(2, 2, figsize=(12, 10))
-                axes = axes.flatten()
-
-                for ax, param in zip(axes, top_params):
-                    x = [r.get(param) for r in merged if param in r]
-                    y = [r.get("v27_hash_share") for r in merged if param in r]
-                    c = [r.get("outcome") for r in merged if param in r]
-
-                    color_map = {"v27_dominant": "#2ecc71", "contested": "#f1c40f", "v26_dominant": "#e74c3c"}
-                    colors = [color_map.get(o, "#95a5a6") for o in c]
-
-                    ax.scatter(x, y, c=colors, alpha=0.6, s=30)
-                    ax.set_xlabel(param)
-                    ax.set_ylabel("v27 Hashrate Share")
-                    ax.axhline(y=0.5, color='gray', linestyle='--', alpha=0.5)
-
-                plt.tight_layout()
-                plt.savefig(figures_dir / "parameter_effects.png", dpi=150, bbox_inches='tight')
-                plt.close()
-
+                panels = []
+                for param, _ in top_thresholds(thresholds, 4):
+                    mask = ~np.isnan(columns[param])
+                    panels.append((param, columns[param][mask],
+                                   columns["v27_hash_share"][mask],
+                                   columns["outcome_id"][mask]))
+                jobs.append((plot_parameter_effects,
+                             (panels, figures_dir / "parameter_effects.png")))
+
+            render_figures(jobs)
             print(f"Saved visualizations to {figures_dir}")
 
-        except ImportError:
-            print("Warning: matplotlib not available, skipping visualizations")
-
     print(f"\n{'='*60}")
     print("Analysis complete!")
     print(f"{'='*60}")
@@ -20,23 +20,164 @@ Usage:
 import re
 import argparse
 import json
+from array import array
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional
 from dataclasses import dataclass
 from datetime import datetime
 import sys
 
-# Try to import matplotlib, but make it optional
+import numpy as np
+
+# orjson writes the JSON export much faster and serializes NumPy arrays natively
 try:
-    import matplotlib
-    matplotlib.use('Agg')  # Non-interactive backend
-    import matplotlib.pyplot as plt
-    import matplotlib.dates as mdates
-    HAS_MATPLOTLIB = True
+    import orjson
 except ImportError:
-    HAS_MATPLOTLIB = False
-    print("Warning: matplotlib not available. Visualizations will be skipped.")
-    print("Install with: pip install matplotlib")
+    orjson = None
+
+# matplotlib is optional and imported on first plot, so --no-plots runs and
+# JSON-only use never pay for it; see _pyplot()
+_plt = None
+
+# Block mining line emitted by partition_miner. Lines carry a logger prefix,
+# so the pattern is searched rather than anchored at the start of the line.
+_BLOCK_RE = re.compile(
+    r'\[\s*(\d+)s\]\s+(v2[67])\s+block by (node-\d+)\s+\|\s+Heights:\s+v27=(\d+)\s+v26=(\d+)'
+    r'\s+\|\s+Fork depth:\s+(\d+)\s+\|\s+Mined:\s+v27=\s*(\d+)\s+v26=\s*(\d+)'
+)
+_DURATION_RE = re.compile(r'Duration:\s+(\d+)\.?\d*\s+minutes')
+
+# BlockEvent field names, in the order they are exported
+_EVENT_FIELDS = (
+    'timestamp_sec', 'version', 'node', 'height_v27', 'height_v26',
+    'fork_depth', 'cumulative_v27', 'cumulative_v26'
+)
+
+# Plot resolution; 150 DPI is plenty for scenario reports and renders and
+# compresses about 4x fewer pixels than 300
+DEFAULT_DPI = 150
+
+# Line plots with more points than this are decimated with LTTB before
+# drawing; beyond ~2000 points the extra detail is lost at plot resolution
+LTTB_THRESHOLD = 4000
+LTTB_POINTS = 2000
+
+# Importing numba costs more than the NumPy rate path saves until logs get
+# very long, so the compiled kernel is only used (and imported) above this size
+NUMBA_MIN_EVENTS = 2_000_000
+
+_window_counts = None
+
+
+def _numba_window_counts():
+    """Return the compiled sliding-window kernel, or False if numba is unavailable"""
+    global _window_counts
+    if _window_counts is not None:
+        return _window_counts
+
+    try:
+        from numba import njit
+    except ImportError:
+        _window_counts = False
+        return _window_counts
+
+    @njit(cache=True, nogil=True)
+    def window_counts(times, is_v27, window_sec):
+        """Two-pointer pass counting v27/v26 blocks in [t - window_sec, t] per event"""
+        n = times.shape[0]
+        v27_counts = np.empty(n, dtype=np.int64)
+        v26_counts = np.empty(n, dtype=np.int64)
+        left = 0
+        right = 0
+        c27 = 0
+        c26 = 0
+        for i in range(n):
+            t = times[i]
+            while right < n and times[right] <= t:
+                if is_v27[right]:
+                    c27 += 1
+                else:
+                    c26 += 1
+                right += 1
+            while times[left] < t - window_sec:
+                if is_v27[left]:
+                    c27 -= 1
+                else:
+                    c26 -= 1
+                left += 1
+            v27_counts[i] = c27
+            v26_counts[i] = c26
+        return v27_counts, v26_counts
+
+    _window_counts = window_counts
+    return _window_counts
+
+
+def _lttb(x, y, n_out: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Downsample a line to n_out points with Largest-Triangle-Three-Buckets.
+
+    The first and last points are always kept. The interior is split into
+    n_out - 2 buckets, and from each bucket the point forming the largest
+    triangle with the previously kept point and the next bucket's average
+    is kept, which preserves peaks and troughs.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return x, y
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0] = 0
+    keep[-1] = n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_lo, next_hi = hi, edges[i + 2]
+            avg_x = x[next_lo:next_hi].mean()
+            avg_y = y[next_lo:next_hi].mean()
+        else:
+            avg_x, avg_y = x[-1], y[-1]
+
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(area.argmax())
+        keep[i + 1] = a
+
+    return x[keep], y[keep]
+
+
+def _decimate(x, y) -> Tuple:
+    """Apply LTTB to series longer than LTTB_THRESHOLD, otherwise return them as-is"""
+    if len(x) > LTTB_THRESHOLD:
+        return _lttb(x, y, LTTB_POINTS)
+    return x, y
+
+
+def _pyplot():
+    """Import matplotlib.pyplot on first use; returns False if it is unavailable"""
+    global _plt
+    if _plt is None:
+        try:
+            import matplotlib
+            matplotlib.use('Agg')  # Non-interactive backend
+            import matplotlib.pyplot as plt
+            _plt = plt
+        except ImportError:
+            _plt = False
+            print("Warning: matplotlib not available. Visualizations will be skipped.")
+            print("Install with: pip install matplotlib")
+    return _plt
+
+
+def _json_default(obj):
+    """Serialize NumPy values that the JSON encoder can't handle natively"""
+    if isinstance(obj, (np.ndarray, np.generic)):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 
 @dataclass
@@ -55,51 +196,113 @@ class BlockEvent:
 class TemporalAnalyzer:
     """Analyzes temporal dynamics of fork tests"""
 
+    # Version codes stored in the _ver column; index into VERSION_NAMES
+    V26 = 0
+    V27 = 1
+    VERSION_NAMES = np.array(['v26', 'v27'])
+
     def __init__(self):
-        self.events: List[BlockEvent] = []
+        # Block events are stored column-wise, one array per field, sorted by
+        # timestamp on ingest. Versions are stored as V27/V26 codes.
+        self._ts = np.empty(0, dtype=np.float64)
+        self._ver = np.empty(0, dtype=np.uint8)
+        self._node: List[str] = []
+        self._h27 = np.empty(0, dtype=np.int64)
+        self._h26 = np.empty(0, dtype=np.int64)
+        self._depth = np.empty(0, dtype=np.int64)
+        self._cum27 = np.empty(0, dtype=np.int64)
+        self._cum26 = np.empty(0, dtype=np.int64)
         self.test_duration: Optional[float] = None
         self.start_height: int = 101  # Default common history height
 
+        # Derived data shared by the plots, export and summary; reset on parse
+        self._ts_cache: Optional[Dict] = None
+        self._stats_cache: Optional[Dict] = None
+
+    def _event_rows(self):
+        """Iterate event fields as plain Python tuples, in timestamp order"""
+        return zip(
+            self._ts.tolist(),
+            self.VERSION_NAMES[self._ver].tolist(),
+            self._node,
+            self._h27.tolist(),
+            self._h26.tolist(),
+            self._depth.tolist(),
+            self._cum27.tolist(),
+            self._cum26.tolist(),
+        )
+
+    @property
+    def events(self) -> List[BlockEvent]:
+        """Block events in timestamp order, materialized from the column arrays"""
+        return [BlockEvent(*row) for row in self._event_rows()]
+
     def parse_scenario_log(self, log_path: str) -> bool:
         """
         Parse partition_miner scenario log for block events.
 
         Format: [  12s] v26 block by node-8 | Heights: v27=102 v26=101 | Fork depth: 1 | Mined: v27=1 v26=1
-        """
-        try:
-            with open(log_path, 'r') as f:
-                content = f.read()
-
-            # Pattern to match block mining lines
-            pattern = r'\[\s*(\d+)s\]\s+(v2[67])\s+block by (node-\d+)\s+\|\s+Heights:\s+v27=(\d+)\s+v26=(\d+)\s+\|\s+Fork depth:\s+(\d+)\s+\|\s+Mined:\s+v27=\s*(\d+)\s+v26=\s*(\d+)'
 
-            matches = re.findall(pattern, content)
+        The log is streamed line by line, so memory stays flat for long runs.
+        Lines may carry a logger prefix (e.g. "partition_miner - ") ahead of
+        the timestamp, and the Duration footer may appear anywhere.
+        """
+        self._ts_cache = None
+        self._stats_cache = None
 
-            if not matches:
+        try:
+            # Fields go straight into typed buffers as each line is matched,
+            # rather than keeping every match's tuple of strings until the end
+            timestamps = array('d')
+            versions = array('B')
+            nodes = []
+            h_v27 = array('q')
+            h_v26 = array('q')
+            fork_depth = array('q')
+            mined_v27 = array('q')
+            mined_v26 = array('q')
+            duration_match = None
+
+            # Decode explicitly as UTF-8 (the codec's fast path, whatever the
+            # locale) and replace stray bytes rather than aborting the parse
+            with open(log_path, 'r', encoding='utf-8', errors='replace') as f:
+                for line in f:
+                    # Cheap substring checks reject the bulk of the log
+                    # before any regex work is done
+                    if '| Fork depth:' in line:
+                        match = _BLOCK_RE.search(line)
+                        if match:
+                            ts, version, node, h27, h26, depth, cum27, cum26 = match.groups()
+                            timestamps.append(int(ts))
+                            versions.append(self.V27 if version == 'v27' else self.V26)
+                            nodes.append(node)
+                            h_v27.append(int(h27))
+                            h_v26.append(int(h26))
+                            fork_depth.append(int(depth))
+                            mined_v27.append(int(cum27))
+                            mined_v26.append(int(cum26))
+                    elif duration_match is None and 'Duration:' in line:
+                        duration_match = _DURATION_RE.search(line)
+
+            if not timestamps:
                 print(f"Warning: No block events found in {log_path}")
                 return False
 
-            for match in matches:
-                timestamp, version, node, h_v27, h_v26, fork_depth, mined_v27, mined_v26 = match
-
-                event = BlockEvent(
-                    timestamp_sec=float(timestamp),
-                    version=version,
-                    node=node,
-                    height_v27=int(h_v27),
-                    height_v26=int(h_v26),
-                    fork_depth=int(fork_depth),
-                    cumulative_v27=int(mined_v27),
-                    cumulative_v26=int(mined_v26)
-                )
-                self.events.append(event)
+            self._ts = np.concatenate((self._ts, np.frombuffer(timestamps, dtype=np.float64)))
+            self._ver = np.concatenate((self._ver, np.frombuffer(versions, dtype=np.uint8)))
+            self._node.extend(nodes)
+            self._h27 = np.concatenate((self._h27, np.frombuffer(h_v27, dtype=np.int64)))
+            self._h26 = np.concatenate((self._h26, np.frombuffer(h_v26, dtype=np.int64)))
+            self._depth = np.concatenate((self._depth, np.frombuffer(fork_depth, dtype=np.int64)))
+            self._cum27 = np.concatenate((self._cum27, np.frombuffer(mined_v27, dtype=np.int64)))
+            self._cum26 = np.concatenate((self._cum26, np.frombuffer(mined_v26, dtype=np.int64)))
+            self._sort_events()
 
             # Detect test duration from log
-            duration_match = re.search(r'Duration:\s+(\d+)\.?\d*\s+minutes', content)
             if duration_match:
                 self.test_duration = float(duration_match.group(1)) * 60
 
-            print(f"✓ Parsed {len(self.events)} block events")
+            print(f"✓ Parsed {len(timestamps)} block events")
             if self.test_duration:
                 print(f"  Test duration: {self.test_duration/60:.1f} minutes")
 
@@ -109,36 +312,45 @@ class TemporalAnalyzer:
             print(f"Error parsing log: {e}")
             return False
 
+    def _sort_events(self):
+        """Put the event columns in timestamp order (stable, so same-second blocks keep log order)"""
+        if np.all(self._ts[:-1] <= self._ts[1:]):
+            return  # Scenario logs are written in time order
+
+        idx = np.argsort(self._ts, kind='stable')
+        self._ts = self._ts[idx]
+        self._ver = self._ver[idx]
+        self._node = [self._node[i] for i in idx.tolist()]
+        self._h27 = self._h27[idx]
+        self._h26 = self._h26[idx]
+        self._depth = self._depth[idx]
+        self._cum27 = self._cum27[idx]
+        self._cum26 = self._cum26[idx]
+
     def generate_time_series_data(self) -> Dict:
-        """Generate structured time-series data from events"""
+        """Generate structured time-series data from events, one NumPy array per series"""
+
+        if self._ts_cache is not None:
+            return self._ts_cache
 
-        if not self.events:
+        if not self._ts.size:
             return {}
 
-        # Sort events by timestamp
-        sorted_events = sorted(self.events, key=lambda e: e.timestamp_sec)
+        h27 = self._h27
+        h26 = self._h26
 
         time_series = {
-            'timestamps': [],
-            'v27_cumulative_blocks': [],
-            'v26_cumulative_blocks': [],
-            'v27_height': [],
-            'v26_height': [],
-            'height_difference': [],
-            'fork_depth': [],
-            'mining_version': []  # Which version mined each block
+            'timestamps': self._ts,
+            'v27_cumulative_blocks': self._cum27,
+            'v26_cumulative_blocks': self._cum26,
+            'v27_height': h27,
+            'v26_height': h26,
+            'height_difference': np.abs(h27 - h26),
+            'fork_depth': self._depth,
+            'mining_version': self.VERSION_NAMES[self._ver]  # Which version mined each block
         }
 
-        for event in sorted_events:
-            time_series['timestamps'].append(event.timestamp_sec)
-            time_series['v27_cumulative_blocks'].append(event.cumulative_v27)
-            time_series['v26_cumulative_blocks'].append(event.cumulative_v26)
-            time_series['v27_height'].append(event.height_v27)
-            time_series['v26_height'].append(event.height_v26)
-            time_series['height_difference'].append(abs(event.height_v27 - event.height_v26))
-            time_series['fork_depth'].append(event.fork_depth)
-            time_series['mining_version'].append(event.version)
-
+        self._ts_cache = time_series
         return time_series
 
     def calculate_mining_rates(self, window_sec: float = 60.0) -> Dict:
@@ -149,94 +361,93 @@ class TemporalAnalyzer:
             window_sec: Window size in seconds for rate calculation
 
         Returns:
-            Dict with timestamps and mining rates (blocks/min)
+            Dict of NumPy arrays with timestamps and mining rates (blocks/min)
         """
-        if not self.events:
+        if not self._ts.size:
             return {}
 
-        sorted_events = sorted(self.events, key=lambda e: e.timestamp_sec)
+        times = self._ts
+        is_v27 = self._ver == self.V27
+
+        # The right edge of each window takes every event stamped at t, not
+        # just those up to the current index
+        kernel = _numba_window_counts() if len(times) >= NUMBA_MIN_EVENTS else False
+        if kernel:
+            v27_count, v26_count = kernel(times, is_v27, float(window_sec))
+        else:
+            # Prefix counts turn each window into two searchsorted lookups
+            cum_v27 = np.concatenate(([0], np.cumsum(is_v27)))
+            cum_v26 = np.arange(len(times) + 1) - cum_v27
+            left = np.searchsorted(times, times - window_sec, side='left')
+            right = np.searchsorted(times, times, side='right')
+            v27_count = cum_v27[right] - cum_v27[left]
+            v26_count = cum_v26[right] - cum_v26[left]
+
+        # Convert to blocks per minute
+        window_min = window_sec / 60.0
+        v27_rate = v27_count / window_min
+        v26_rate = v26_count / window_min
 
         rates = {
-            'timestamps': [],
-            'v27_rate': [],  # blocks per minute
-            'v26_rate': [],
-            'total_rate': []
+            'timestamps': times,
+            'v27_rate': v27_rate,  # blocks per minute
+            'v26_rate': v26_rate,
+            'total_rate': v27_rate + v26_rate
         }
 
-        # Calculate rate at each event timestamp
-        for i, event in enumerate(sorted_events):
-            t = event.timestamp_sec
-
-            # Count blocks in window [t - window_sec, t]
-            v27_count = sum(1 for e in sorted_events
-                           if t - window_sec <= e.timestamp_sec <= t and e.version == 'v27')
-            v26_count = sum(1 for e in sorted_events
-                           if t - window_sec <= e.timestamp_sec <= t and e.version == 'v26')
-
-            # Convert to blocks per minute
-            window_min = window_sec / 60.0
-            v27_rate = v27_count / window_min
-            v26_rate = v26_count / window_min
-
-            rates['timestamps'].append(t)
-            rates['v27_rate'].append(v27_rate)
-            rates['v26_rate'].append(v26_rate)
-            rates['total_rate'].append(v27_rate + v26_rate)
-
         return rates
 
     def generate_summary_statistics(self) -> Dict:
         """Generate summary statistics from the time series"""
 
-        if not self.events:
+        if self._stats_cache is not None:
+            return self._stats_cache
+
+        if not self._ts.size:
             return {}
 
-        sorted_events = sorted(self.events, key=lambda e: e.timestamp_sec)
-        last_event = sorted_events[-1]
+        last = -1
+        last_timestamp = float(self._ts[last])
 
-        v27_blocks = last_event.cumulative_v27
-        v26_blocks = last_event.cumulative_v26
+        v27_blocks = int(self._cum27[last])
+        v26_blocks = int(self._cum26[last])
         total_blocks = v27_blocks + v26_blocks
 
         # Calculate average time between blocks
-        v27_events = [e for e in sorted_events if e.version == 'v27']
-        v26_events = [e for e in sorted_events if e.version == 'v26']
+        times = self._ts
+        versions = self._ver
 
-        v27_avg_time = None
-        v26_avg_time = None
+        v27_intervals = np.diff(times[versions == self.V27])
+        v26_intervals = np.diff(times[versions == self.V26])
 
-        if len(v27_events) > 1:
-            v27_times = [e.timestamp_sec for e in v27_events]
-            v27_intervals = [v27_times[i+1] - v27_times[i] for i in range(len(v27_times)-1)]
-            v27_avg_time = sum(v27_intervals) / len(v27_intervals) if v27_intervals else None
-
-        if len(v26_events) > 1:
-            v26_times = [e.timestamp_sec for e in v26_events]
-            v26_intervals = [v26_times[i+1] - v26_times[i] for i in range(len(v26_times)-1)]
-            v26_avg_time = sum(v26_intervals) / len(v26_intervals) if v26_intervals else None
+        v27_avg_time = float(v27_intervals.mean()) if v27_intervals.size else None
+        v26_avg_time = float(v26_intervals.mean()) if v26_intervals.size else None
 
         stats = {
-            'total_duration_sec': last_event.timestamp_sec,
+            'total_duration_sec': last_timestamp,
             'total_blocks_mined': total_blocks,
             'v27_blocks': v27_blocks,
             'v26_blocks': v26_blocks,
             'v27_percentage': (v27_blocks / total_blocks * 100) if total_blocks > 0 else 0,
             'v26_percentage': (v26_blocks / total_blocks * 100) if total_blocks > 0 else 0,
-            'final_fork_depth': last_event.fork_depth,
-            'final_v27_height': last_event.height_v27,
-            'final_v26_height': last_event.height_v26,
+            'final_fork_depth': int(self._depth[last]),
+            'final_v27_height': int(self._h27[last]),
+            'final_v26_height': int(self._h26[last]),
             'v27_avg_block_time_sec': v27_avg_time,
             'v26_avg_block_time_sec': v26_avg_time,
-            'v27_blocks_per_min': (v27_blocks / (last_event.timestamp_sec / 60)) if last_event.timestamp_sec > 0 else 0,
-            'v26_blocks_per_min': (v26_blocks / (last_event.timestamp_sec / 60)) if last_event.timestamp_sec > 0 else 0
+            'v27_blocks_per_min': (v27_blocks / (last_timestamp / 60)) if last_timestamp > 0 else 0,
+            'v26_blocks_per_min': (v26_blocks / (last_timestamp / 60)) if last_timestamp > 0 else 0
         }
 
+        self._stats_cache = stats
         return stats
 
-    def plot_cumulative_blocks(self, output_path: str):
+    def plot_cumulative_blocks(self, output_path: str, dpi: int = DEFAULT_DPI,
+                               times_min: Optional[np.ndarray] = None):
         """Plot cumulative blocks mined over time"""
 
-        if not HAS_MATPLOTLIB:
+        plt = _pyplot()
+        if not plt:
             print("  Skipping plot: matplotlib not available")
             return
 
@@ -244,10 +455,11 @@ class TemporalAnalyzer:
         if not ts:
             return
 
-        fig, ax = plt.subplots(figsize=(12, 6))
+        fig, ax = plt.subplots(figsize=(12, 6), layout='constrained')
 
         # Convert timestamps to minutes
-        times_min = [t/60 for t in ts['timestamps']]
+        if times_min is None:
+            times_min = ts['timestamps'] / 60
 
         ax.plot(times_min, ts['v27_cumulative_blocks'], 'b-o', label='v27 blocks', linewidth=2, markersize=6)
         ax.plot(times_min, ts['v26_cumulative_blocks'], 'r-o', label='v26 blocks', linewidth=2, markersize=6)
@@ -258,16 +470,17 @@ class TemporalAnalyzer:
         ax.legend(fontsize=11)
         ax.grid(True, alpha=0.3)
 
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(output_path, dpi=dpi)
+        plt.close(fig)
 
         print(f"✓ Saved cumulative blocks plot: {output_path}")
 
-    def plot_mining_rates(self, output_path: str, window_sec: float = 120.0):
+    def plot_mining_rates(self, output_path: str, window_sec: float = 120.0, dpi: int = DEFAULT_DPI,
+                          times_min: Optional[np.ndarray] = None):
         """Plot mining rates over time with rolling window"""
 
-        if not HAS_MATPLOTLIB:
+        plt = _pyplot()
+        if not plt:
             print("  Skipping plot: matplotlib not available")
             return
 
@@ -275,14 +488,15 @@ class TemporalAnalyzer:
         if not rates:
             return
 
-        fig, ax = plt.subplots(figsize=(12, 6))
+        fig, ax = plt.subplots(figsize=(12, 6), layout='constrained')
 
         # Convert timestamps to minutes
-        times_min = [t/60 for t in rates['timestamps']]
+        if times_min is None:
+            times_min = rates['timestamps'] / 60
 
-        ax.plot(times_min, rates['v27_rate'], 'b-', label='v27 rate', linewidth=2, alpha=0.7)
-        ax.plot(times_min, rates['v26_rate'], 'r-', label='v26 rate', linewidth=2, alpha=0.7)
-        ax.plot(times_min, rates['total_rate'], 'g--', label='Total rate', linewidth=2, alpha=0.5)
+        ax.plot(*_decimate(times_min, rates['v27_rate']), 'b-', label='v27 rate', linewidth=2, alpha=0.7)
+        ax.plot(*_decimate(times_min, rates['v26_rate']), 'r-', label='v26 rate', linewidth=2, alpha=0.7)
+        ax.plot(*_decimate(times_min, rates['total_rate']), 'g--', label='Total rate', linewidth=2, alpha=0.5)
 
         # Add expected rate line (6 blocks/hour = 0.1 blocks/min in Bitcoin)
         expected_rate = 0.1
@@ -295,16 +509,17 @@ class TemporalAnalyzer:
         ax.legend(fontsize=11)
         ax.grid(True, alpha=0.3)
 
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(output_path, dpi=dpi)
+        plt.close(fig)
 
         print(f"✓ Saved mining rates plot: {output_path}")
 
-    def plot_fork_evolution(self, output_path: str):
+    def plot_fork_evolution(self, output_path: str, dpi: int = DEFAULT_DPI,
+                            times_min: Optional[np.ndarray] = None):
         """Plot fork depth and height difference evolution"""
 
-        if not HAS_MATPLOTLIB:
+        plt = _pyplot()
+        if not plt:
             print("  Skipping plot: matplotlib not available")
             return
 
@@ -312,10 +527,11 @@ class TemporalAnalyzer:
         if not ts:
             return
 
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10))
+        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10), layout='constrained')
 
         # Convert timestamps to minutes
-        times_min = [t/60 for t in ts['timestamps']]
+        if times_min is None:
+            times_min = ts['timestamps'] / 60
 
         # Plot 1: Heights over time
         ax1.plot(times_min, ts['v27_height'], 'b-o', label='v27 height', linewidth=2, markersize=5)
@@ -338,16 +554,17 @@ class TemporalAnalyzer:
         ax2.set_title('Fork Depth Evolution', fontsize=14, fontweight='bold')
         ax2.grid(True, alpha=0.3)
 
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(output_path, dpi=dpi)
+        plt.close(fig)
 
         print(f"✓ Saved fork evolution plot: {output_path}")
 
-    def plot_height_difference(self, output_path: str):
+    def plot_height_difference(self, output_path: str, dpi: int = DEFAULT_DPI,
+                               times_min: Optional[np.ndarray] = None):
         """Plot absolute height difference over time"""
 
-        if not HAS_MATPLOTLIB:
+        plt = _pyplot()
+        if not plt:
             print("  Skipping plot: matplotlib not available")
             return
 
@@ -355,25 +572,46 @@ class TemporalAnalyzer:
         if not ts:
             return
 
-        fig, ax = plt.subplots(figsize=(12, 6))
+        fig, ax = plt.subplots(figsize=(12, 6), layout='constrained')
 
         # Convert timestamps to minutes
-        times_min = [t/60 for t in ts['timestamps']]
+        if times_min is None:
+            times_min = ts['timestamps'] / 60
+        times_min, height_difference = _decimate(times_min, ts['height_difference'])
 
-        ax.plot(times_min, ts['height_difference'], 'orange', linewidth=2.5, marker='s', markersize=5)
-        ax.fill_between(times_min, 0, ts['height_difference'], alpha=0.2, color='orange')
+        ax.plot(times_min, height_difference, 'orange', linewidth=2.5, marker='s', markersize=5)
+        ax.fill_between(times_min, 0, height_difference, alpha=0.2, color='orange')
 
         ax.set_xlabel('Time (minutes)', fontsize=12)
         ax.set_ylabel('|Height(v27) - Height(v26)|', fontsize=12)
         ax.set_title('Chain Height Difference Over Time', fontsize=14, fontweight='bold')
         ax.grid(True, alpha=0.3)
 
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(output_path, dpi=dpi)
+        plt.close(fig)
 
         print(f"✓ Saved height difference plot: {output_path}")
 
+    def render_all(self, output_dir: Path, dpi: int = DEFAULT_DPI, rate_window: float = 120.0):
+        """Write all four plots to output_dir, sharing the time series and minute axis"""
+
+        if not _pyplot():
+            print("  Skipping plots: matplotlib not available")
+            return
+
+        ts = self.generate_time_series_data()
+        if not ts:
+            return
+
+        # Rates are sampled at the same (sorted) event timestamps
+        times_min = ts['timestamps'] / 60
+
+        self.plot_cumulative_blocks(str(output_dir / 'cumulative_blocks.png'), dpi=dpi, times_min=times_min)
+        self.plot_mining_rates(str(output_dir / 'mining_rates.png'), window_sec=rate_window, dpi=dpi,
+                               times_min=times_min)
+        self.plot_fork_evolution(str(output_dir / 'fork_evolution.png'), dpi=dpi, times_min=times_min)
+        self.plot_height_difference(str(output_dir / 'height_difference.png'), dpi=dpi, times_min=times_min)
+
     def export_time_series_json(self, output_path: str):
         """Export time series data as JSON for further analysis"""
 
@@ -384,22 +622,18 @@ class TemporalAnalyzer:
             'summary_statistics': stats,
             'time_series': ts,
             'events': [
-                {
-                    'timestamp_sec': e.timestamp_sec,
-                    'version': e.version,
-                    'node': e.node,
-                    'height_v27': e.height_v27,
-                    'height_v26': e.height_v26,
-                    'fork_depth': e.fork_depth,
-                    'cumulative_v27': e.cumulative_v27,
-                    'cumulative_v26': e.cumulative_v26
-                }
-                for e in self.events
+                dict(zip(_EVENT_FIELDS, row))
+                for row in self._event_rows()
             ]
         }
 
-        with open(output_path, 'w') as f:
-            json.dump(export_data, f, indent=2)
+        if orjson is not None:
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(export_data, default=_json_default,
+                                     option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            with open(output_path, 'w') as f:
+                json.dump(export_data, f, indent=2, default=_json_default)
 
         print(f"✓ Exported time series data: {output_path}")
 
@@ -411,30 +645,31 @@ class TemporalAnalyzer:
             print("No data to summarize")
             return
 
-        print("\n" + "="*70)
-        print("TEMPORAL ANALYSIS SUMMARY")
-        print("="*70)
-        print(f"Test Duration: {stats['total_duration_sec']:.1f}s ({stats['total_duration_sec']/60:.1f} min)")
-        print(f"Total Blocks Mined: {stats['total_blocks_mined']}")
-        print()
-        print(f"v27 Performance:")
-        print(f"  Blocks: {stats['v27_blocks']} ({stats['v27_percentage']:.1f}%)")
-        print(f"  Final Height: {stats['final_v27_height']}")
-        print(f"  Mining Rate: {stats['v27_blocks_per_min']:.3f} blocks/min")
-        if stats['v27_avg_block_time_sec']:
-            print(f"  Avg Time Between Blocks: {stats['v27_avg_block_time_sec']:.1f}s")
-        print()
-        print(f"v26 Performance:")
-        print(f"  Blocks: {stats['v26_blocks']} ({stats['v26_percentage']:.1f}%)")
-        print(f"  Final Height: {stats['final_v26_height']}")
-        print(f"  Mining Rate: {stats['v26_blocks_per_min']:.3f} blocks/min")
-        if stats['v26_avg_block_time_sec']:
-            print(f"  Avg Time Between Blocks: {stats['v26_avg_block_time_sec']:.1f}s")
-        print()
-        print(f"Fork Metrics:")
-        print(f"  Final Fork Depth: {stats['final_fork_depth']} blocks")
-        print(f"  Height Difference: {abs(stats['final_v27_height'] - stats['final_v26_height'])} blocks")
-        print("="*70)
+        # Collect the report and write it in one go rather than line by line
+        lines = [
+            "",
+            "="*70,
+            "TEMPORAL ANALYSIS SUMMARY",
+            "="*70,
+            f"Test Duration: {stats['total_duration_sec']:.1f}s ({stats['total_duration_sec']/60:.1f} min)",
+            f"Total Blocks Mined: {stats['total_blocks_mined']}",
+            "",
+        ]
+        for version in ('v27', 'v26'):
+            lines.append(f"{version} Performance:")
+            lines.append(f"  Blocks: {stats[f'{version}_blocks']} ({stats[f'{version}_percentage']:.1f}%)")
+            lines.append(f"  Final Height: {stats[f'final_{version}_height']}")
+            lines.append(f"  Mining Rate: {stats[f'{version}_blocks_per_min']:.3f} blocks/min")
+            if stats[f'{version}_avg_block_time_sec']:
+                lines.append(f"  Avg Time Between Blocks: {stats[f'{version}_avg_block_time_sec']:.1f}s")
+            lines.append("")
+        lines += [
+            "Fork Metrics:",
+            f"  Final Fork Depth: {stats['final_fork_depth']} blocks",
+            f"  Height Difference: {abs(stats['final_v27_height'] - stats['final_v26_height'])} blocks",
+            "="*70,
+        ]
+        print("\n".join(lines))
 
 
 def main():
@@ -487,6 +722,13 @@ Examples:
         help='Skip generating plots (only export data)'
     )
 
+    parser.add_argument(
+        '--dpi',
+        type=int,
+        default=DEFAULT_DPI,
+        help=f'Resolution of saved plots (default: {DEFAULT_DPI})'
+    )
+
     parser.add_argument(
         '--start-height',
         type=int,
@@ -524,10 +766,7 @@ Examples:
     # Generate plots if not disabled
     if not args.no_plots:
         print("\nGenerating visualizations...")
-        analyzer.plot_cumulative_blocks(str(output_dir / 'cumulative_blocks.png'))
-        analyzer.plot_mining_rates(str(output_dir / 'mining_rates.png'), window_sec=args.rate_window)
-        analyzer.plot_fork_evolution(str(output_dir / 'fork_evolution.png'))
-        analyzer.plot_height_difference(str(output_dir / 'height_difference.png'))
+        analyzer.render_all(output_dir, dpi=args.dpi, rate_window=args.rate_window)
 
     print(f"\n✓ Analysis complete! Results saved to: {output_dir}")
     return 0
@@ -24,16 +24,108 @@ Usage:
 
 import json
 import argparse
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+import os
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Union, Optional
 import sys
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 import math
 
+import numpy as np
+
+# orjson parses the per-test result files several times faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Importing numba costs more than the NumPy evaluation saves until the
+# result set is very large, so the fused kernel is only used past this size
+NUMBA_MIN_RESULTS = 1_000_000
+
+_evaluate_kernel = None
+
+
+def _numba_evaluate():
+    """Return the compiled fused metrics kernel, or False if numba is unavailable"""
+    global _evaluate_kernel
+    if _evaluate_kernel is not None:
+        return _evaluate_kernel
+
+    try:
+        from numba import njit
+    except ImportError:
+        _evaluate_kernel = False
+        return _evaluate_kernel
+
+    @njit(cache=True, nogil=True)
+    def evaluate(v27_custody, v27_volume, v26_custody, v26_volume,
+                 blocks_v27, blocks_v26, custody_weight, volume_weight):
+        """Correlation, winner credit and squared-error sum for one weight pair, without temporaries"""
+        n = blocks_v27.shape[0]
+
+        sum_w = 0.0
+        sum_b = 0.0
+        for i in range(n):
+            v27_w = v27_custody[i] * custody_weight + v27_volume[i] * volume_weight
+            v26_w = v26_custody[i] * custody_weight + v26_volume[i] * volume_weight
+            sum_w += v27_w - v26_w
+            sum_b += blocks_v27[i] - blocks_v26[i]
+        mean_w = sum_w / n
+        mean_b = sum_b / n
+
+        cov = 0.0
+        var_w = 0.0
+        var_b = 0.0
+        correct = 0.0
+        squared_error_sum = 0.0
+        scored = 0
+        for i in range(n):
+            v27_w = v27_custody[i] * custody_weight + v27_volume[i] * volume_weight
+            v26_w = v26_custody[i] * custody_weight + v26_volume[i] * volume_weight
+            weight_adv = v27_w - v26_w
+            block_adv = blocks_v27[i] - blocks_v26[i]
+
+            dw = weight_adv - mean_w
+            db = block_adv - mean_b
+            cov += dw * db
+            var_w += dw * dw
+            var_b += db * db
+
+            if (weight_adv > 0 and block_adv > 0) or (weight_adv < 0 and block_adv < 0):
+                correct += 1.0
+            elif weight_adv == 0 or block_adv == 0:
+                correct += 0.5
+
+            total_blocks = blocks_v27[i] + blocks_v26[i]
+            total_weight = v27_w + v26_w
+            if total_blocks > 0 and total_weight > 0:
+                error = (v27_w / total_weight) * total_blocks - blocks_v27[i]
+                squared_error_sum += error * error
+                scored += 1
+
+        if var_w == 0 or var_b == 0:
+            correlation = 0.0
+        else:
+            correlation = cov / (np.sqrt(var_w) * np.sqrt(var_b))
+        return correlation, correct, squared_error_sum, scored
+
+    _evaluate_kernel = evaluate
+    return _evaluate_kernel
+
 
 @dataclass
 class TestResult:
     """Parsed test result with economic and mining data"""
+    # Explicit slots (dataclass(slots=True) needs 3.10) drop the per-instance
+    # __dict__; fields have no defaults, so they don't clash with the slots
+    __slots__ = ('config_id', 'econ_v27_pct', 'econ_v26_pct', 'hash_v27_pct', 'hash_v26_pct',
+                 'blocks_v27', 'blocks_v26', 'fork_depth',
+                 'v27_custody_pct', 'v27_volume_pct', 'v26_custody_pct', 'v26_volume_pct')
+
     config_id: str
     econ_v27_pct: float
     econ_v26_pct: float
@@ -42,8 +134,18 @@ class TestResult:
     blocks_v27: int
     blocks_v26: int
     fork_depth: int
-    v27_nodes: List[Dict]  # Economic nodes on v27
-    v26_nodes: List[Dict]  # Economic nodes on v26
+    # Chain totals of node custody (% of circulating supply) and daily volume
+    # (% of on-chain volume); they don't depend on the weights being tested
+    v27_custody_pct: float
+    v27_volume_pct: float
+    v26_custody_pct: float
+    v26_volume_pct: float
+
+
+# With --cache-dir, parsed results are cached as a column bundle so repeat
+# runs over the same results directory skip parsing entirely. Bump
+# CACHE_VERSION whenever the bundle layout or TestResult columns change.
+CACHE_VERSION = 2
 
 
 class WeightOptimizer:
@@ -55,6 +157,7 @@ class WeightOptimizer:
 
     def __init__(self):
         self.test_results: List[TestResult] = []
+        self._columns: Dict[str, np.ndarray] = {}
 
         # Weight combinations to test
         self.weights_to_test = [
@@ -74,123 +177,257 @@ class WeightOptimizer:
             (0.9, 0.1),  # 90% custody, 10% volume - extreme custody dominance
         ]
 
-    def load_test_results(self, results_dir: str) -> int:
-        """Load all test results from directory"""
+    def load_test_results(self, results_dir: str, cache_dir: Optional[str] = None,
+                          workers: int = 1) -> int:
+        """Load all test results from directory, reusing a parse cache in cache_dir if given"""
 
         results_path = Path(results_dir)
         if not results_path.exists():
             print(f"Error: Results directory not found: {results_dir}")
             return 0
 
-        loaded = 0
-        for result_file in results_path.glob('*_result.json'):
+        # scandir hands back names (and stat results) without building a
+        # Path per entry; same matches and order as glob('*_result.json')
+        try:
+            with os.scandir(results_path) as it:
+                entries = [entry for entry in it if entry.name.endswith('_result.json')]
+        except NotADirectoryError:
+            entries = []  # glob() on a file matched nothing either
+        signature = self._results_signature(entries)
+        result_files = [entry.path for entry in entries]
+
+        cache_file = self._cache_file(results_path, cache_dir) if cache_dir else None
+        cached = self._load_cache(cache_file, signature) if cache_file else None
+        if cached is not None:
+            results, warnings = cached
+            for warning in warnings:
+                print(warning)
+            self.test_results.extend(results)
+            print(f"✓ Loaded {len(results)} test results with economic data")
+            return len(results)
+
+        results = []
+        warnings = []
+        if workers > 1 and len(result_files) > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                parsed = list(executor.map(self._load_result_file, result_files,
+                                           chunksize=max(1, len(result_files) // (workers * 4))))
+        else:
+            parsed = map(self._load_result_file, result_files)
+
+        for result, warning in parsed:
+            if warning is not None:
+                print(warning)
+                warnings.append(warning)
+            elif result is not None:
+                results.append(result)
+
+        if cache_file:
+            self._save_cache(cache_file, signature, results, warnings)
+
+        self.test_results.extend(results)
+        print(f"✓ Loaded {len(results)} test results with economic data")
+        return len(results)
+
+    def _load_result_file(self, result_file: str) -> Tuple[Optional[TestResult], Optional[str]]:
+        """Load one result file, returning (result, None), (None, None) if skipped, or (None, warning)"""
+
+        try:
+            return self._parse_result_file(result_file), None
+        except Exception as e:
+            return None, f"Warning: Could not load {os.path.basename(result_file)}: {e}"
+
+    def _parse_result_file(self, result_file: str) -> Optional[TestResult]:
+        """Parse a result file, or None for failed tests and tests without a fork"""
+
+        data = self._read_json(result_file)
+
+        # Skip failed tests or tests without economic analysis, before
+        # touching any of the nested chain data
+        if data['status'] != 'success':
+            return None
+        econ_data = data.get('economic_analysis')
+        if not econ_data:
+            return None
+        if data.get('fork_depth', 0) == 0:
+            return None  # Skip tests with no fork
+
+        # Extract economic nodes
+        chains = econ_data.get('chains', {})
+
+        # Determine which chain is v27 vs v26 based on heights
+        # (economic analysis labels chains as A/B, not by version)
+        chain_a_nodes = chains.get('chain_a', {}).get('economic_nodes', [])
+        chain_b_nodes = chains.get('chain_b', {}).get('economic_nodes', [])
+
+        # For now, match by node count or use heuristic
+        # v27 usually has fewer nodes in our tests
+        if len(chain_a_nodes) < len(chain_b_nodes):
+            v27_nodes, v26_nodes = chain_a_nodes, chain_b_nodes
+        else:
+            v27_nodes, v26_nodes = chain_b_nodes, chain_a_nodes
+
+        v27_custody_pct, v27_volume_pct = self._node_percentages(v27_nodes)
+        v26_custody_pct, v26_volume_pct = self._node_percentages(v26_nodes)
+
+        return TestResult(
+            config_id=data['config_id'],
+            econ_v27_pct=data['splits']['economic']['v27'],
+            econ_v26_pct=data['splits']['economic']['v26'],
+            hash_v27_pct=data['splits']['hashrate']['v27'],
+            hash_v26_pct=data['splits']['hashrate']['v26'],
+            blocks_v27=data['steps']['mining']['blocks']['v27'],
+            blocks_v26=data['steps']['mining']['blocks']['v26'],
+            fork_depth=data['fork_depth'],
+            v27_custody_pct=v27_custody_pct,
+            v27_volume_pct=v27_volume_pct,
+            v26_custody_pct=v26_custody_pct,
+            v26_volume_pct=v26_volume_pct
+        )
+
+    def _read_json(self, result_file: str):
+        """Parse a result file, with orjson when available"""
+
+        with open(result_file, 'rb') as f:
+            raw = f.read()
+        if orjson is not None:
             try:
-                with open(result_file) as f:
-                    data = json.load(f)
-
-                # Skip failed tests or tests without economic analysis
-                if data['status'] != 'success':
-                    continue
-                if not data.get('economic_analysis'):
-                    continue
-                if data.get('fork_depth', 0) == 0:
-                    continue  # Skip tests with no fork
-
-                # Extract economic nodes
-                econ_data = data.get('economic_analysis', {})
-                chains = econ_data.get('chains', {})
-
-                v27_nodes = []
-                v26_nodes = []
-
-                # Determine which chain is v27 vs v26 based on heights
-                # (economic analysis labels chains as A/B, not by version)
-                chain_a = chains.get('chain_a', {})
-                chain_b = chains.get('chain_b', {})
-
-                # Get version assignments from fork metadata if available
-                fork_meta = econ_data.get('fork_metadata', {})
-
-                # For now, match by node count or use heuristic
-                # v27 usually has fewer nodes in our tests
-                if len(chain_a.get('economic_nodes', [])) < len(chain_b.get('economic_nodes', [])):
-                    v27_nodes = chain_a.get('economic_nodes', [])
-                    v26_nodes = chain_b.get('economic_nodes', [])
-                else:
-                    v27_nodes = chain_b.get('economic_nodes', [])
-                    v26_nodes = chain_a.get('economic_nodes', [])
-
-                result = TestResult(
-                    config_id=data['config_id'],
-                    econ_v27_pct=data['splits']['economic']['v27'],
-                    econ_v26_pct=data['splits']['economic']['v26'],
-                    hash_v27_pct=data['splits']['hashrate']['v27'],
-                    hash_v26_pct=data['splits']['hashrate']['v26'],
-                    blocks_v27=data['steps']['mining']['blocks']['v27'],
-                    blocks_v26=data['steps']['mining']['blocks']['v26'],
-                    fork_depth=data['fork_depth'],
-                    v27_nodes=v27_nodes,
-                    v26_nodes=v26_nodes
-                )
-
-                self.test_results.append(result)
-                loaded += 1
-
-            except Exception as e:
-                print(f"Warning: Could not load {result_file.name}: {e}")
-                continue
-
-        print(f"✓ Loaded {loaded} test results with economic data")
-        return loaded
-
-    def calculate_consensus_weight(self, nodes: List[Dict],
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                pass  # json accepts NaN/Infinity and big ints, and reports errors as before
+        return json.loads(raw)
+
+    def _results_signature(self, entries: List[os.DirEntry]) -> str:
+        """Hash the name, size and mtime of every result file, in load order"""
+
+        digest = hashlib.sha1(f"{CACHE_VERSION}:{','.join(f.name for f in fields(TestResult))}".encode())
+        for entry in entries:
+            st = entry.stat()
+            digest.update(f"{entry.name}\0{st.st_size}\0{st.st_mtime_ns}\n".encode())
+        return digest.hexdigest()
+
+    @staticmethod
+    def _cache_file(results_path: Path, cache_dir: str) -> Path:
+        """Cache bundle for one results directory, so several can share a cache_dir"""
+
+        key = hashlib.sha1(str(results_path.resolve()).encode()).hexdigest()[:16]
+        return Path(cache_dir) / f"weight_optimizer_{key}.npz"
+
+    def _load_cache(self, cache_file: Path, signature: str) -> Optional[Tuple[List[TestResult], List[str]]]:
+        """Return cached (results, warnings) if the cache matches the current files, else None"""
+
+        try:
+            with np.load(cache_file, allow_pickle=False) as bundle:
+                if int(bundle['version']) != CACHE_VERSION or str(bundle['signature']) != signature:
+                    return None
+                columns = [bundle[f.name].tolist() for f in fields(TestResult)]
+                warnings = bundle['warnings'].tolist()
+        except (OSError, KeyError, ValueError):
+            return None
+
+        return [TestResult(*row) for row in zip(*columns)], warnings
+
+    def _save_cache(self, cache_file: Path, signature: str,
+                    results: List[TestResult], warnings: List[str]):
+        """Write the parsed results as a column bundle; failures only cost the next run a re-parse"""
+
+        columns = {f.name: np.array([getattr(r, f.name) for r in results]) for f in fields(TestResult)}
+        if any(column.dtype == object for column in columns.values()):
+            return  # Unexpected value types; not worth pickling
+
+        tmp_file = cache_file.with_name(cache_file.name + '.tmp')
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_file, 'wb') as f:
+                np.savez(f, version=np.array(CACHE_VERSION), signature=np.array(signature),
+                         warnings=np.array(warnings, dtype=str), **columns)
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            pass
+
+    def _result_columns(self) -> Dict[str, np.ndarray]:
+        """Stack the per-result chain totals and block counts into arrays (rebuilt when results change)"""
+
+        n = len(self.test_results)
+        if self._columns.get('n') != n:
+            results = self.test_results
+            self._columns = {
+                'n': n,
+                'v27_custody_pct': np.fromiter((r.v27_custody_pct for r in results), np.float64, n),
+                'v27_volume_pct': np.fromiter((r.v27_volume_pct for r in results), np.float64, n),
+                'v26_custody_pct': np.fromiter((r.v26_custody_pct for r in results), np.float64, n),
+                'v26_volume_pct': np.fromiter((r.v26_volume_pct for r in results), np.float64, n),
+                'blocks_v27': np.fromiter((r.blocks_v27 for r in results), np.int64, n),
+                'blocks_v26': np.fromiter((r.blocks_v26 for r in results), np.int64, n),
+            }
+
+            # The block side of every metric is the same for all weight
+            # combinations, so its centring and sum of squares are done once here
+            blocks_v27 = self._columns['blocks_v27']
+            blocks_v26 = self._columns['blocks_v26']
+            block_advantages = blocks_v27 - blocks_v26
+            block_advantages_centered = block_advantages - (block_advantages.mean() if n else 0.0)
+            self._columns.update({
+                'block_advantages': block_advantages,
+                'v27_mined_more': block_advantages > 0,
+                'v26_mined_more': block_advantages < 0,
+                'blocks_tied': block_advantages == 0,
+                'block_advantages_centered': block_advantages_centered,
+                'block_advantages_ss': float(np.dot(block_advantages_centered, block_advantages_centered)),
+                'total_blocks': blocks_v27 + blocks_v26,
+            })
+        return self._columns
+
+    def _node_percentages(self, nodes: List[Dict]) -> Tuple[float, float]:
+        """Sum custody and volume percentages over a chain's economic nodes"""
+
+        custody_pct = sum((node.get('custody_btc', 0) / self.CIRCULATING_SUPPLY) * 100
+                          for node in nodes)
+        volume_pct = sum((node.get('daily_volume_btc', 0) / self.DAILY_ONCHAIN_VOLUME) * 100
+                         for node in nodes)
+        return float(custody_pct), float(volume_pct)
+
+    def calculate_consensus_weight(self, custody_pct: float,
+                                   volume_pct: float,
                                    custody_weight: float,
                                    volume_weight: float) -> float:
         """
         Calculate total consensus weight for a set of nodes with given weights.
 
+        The weights distribute over the node sum, so this only needs the
+        chain totals precomputed by load_test_results.
+
         Args:
-            nodes: List of economic node dicts
+            custody_pct: Total custody of the nodes as % of circulating supply
+            volume_pct: Total daily volume of the nodes as % of daily on-chain volume
             custody_weight: Weight for custody (0-1)
             volume_weight: Weight for volume (0-1)
 
         Returns:
             Total consensus weight percentage
         """
-        total_weight = 0.0
-
-        for node in nodes:
-            custody_btc = node.get('custody_btc', 0)
-            volume_btc = node.get('daily_volume_btc', 0)
-
-            # Calculate percentages
-            custody_pct = (custody_btc / self.CIRCULATING_SUPPLY) * 100
-            volume_pct = (volume_btc / self.DAILY_ONCHAIN_VOLUME) * 100
-
-            # Apply weights
-            node_weight = (custody_pct * custody_weight) + (volume_pct * volume_weight)
-            total_weight += node_weight
-
-        return total_weight
+        return (custody_pct * custody_weight) + (volume_pct * volume_weight)
 
-    def calculate_correlation(self, x: List[float], y: List[float]) -> float:
+    def calculate_correlation(self, x: Union[List[float], np.ndarray],
+                              y: Union[List[float], np.ndarray]) -> float:
         """Calculate Pearson correlation coefficient"""
 
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
         if len(x) != len(y) or len(x) == 0:
             return 0.0
 
-        n = len(x)
-        mean_x = sum(x) / n
-        mean_y = sum(y) / n
+        dx = x - x.mean()
+        dy = y - y.mean()
 
-        cov = sum((x[i] - mean_x) * (y[i] - mean_y) for i in range(n))
-        var_x = sum((xi - mean_x) ** 2 for xi in x)
-        var_y = sum((yi - mean_y) ** 2 for yi in y)
+        cov = np.dot(dx, dy)
+        var_x = np.dot(dx, dx)
+        var_y = np.dot(dy, dy)
 
         if var_x == 0 or var_y == 0:
             return 0.0
 
-        return cov / (math.sqrt(var_x) * math.sqrt(var_y))
+        return float(cov / (math.sqrt(var_x) * math.sqrt(var_y)))
 
     def evaluate_weights(self, custody_weight: float, volume_weight: float) -> Dict:
         """
@@ -205,61 +442,82 @@ class WeightOptimizer:
         if not self.test_results:
             return {}
 
-        # Calculate metrics
-        weight_advantages = []  # v27 weight - v26 weight
-        block_advantages = []   # v27 blocks - v26 blocks
-        winner_predictions_correct = 0
-        squared_errors = []
+        cols = self._result_columns()
+        blocks_v27 = cols['blocks_v27']
+        blocks_v26 = cols['blocks_v26']
 
-        for result in self.test_results:
-            # Calculate consensus weights with these weight parameters
-            v27_weight = self.calculate_consensus_weight(
-                result.v27_nodes, custody_weight, volume_weight
+        kernel = _numba_evaluate() if cols['n'] >= NUMBA_MIN_RESULTS else False
+        if kernel:
+            correlation, winner_predictions_correct, squared_error_sum, scored = kernel(
+                cols['v27_custody_pct'], cols['v27_volume_pct'],
+                cols['v26_custody_pct'], cols['v26_volume_pct'],
+                blocks_v27, blocks_v26, custody_weight, volume_weight
             )
-            v26_weight = self.calculate_consensus_weight(
-                result.v26_nodes, custody_weight, volume_weight
-            )
-
-            weight_adv = v27_weight - v26_weight
-            block_adv = result.blocks_v27 - result.blocks_v26
-
-            weight_advantages.append(weight_adv)
-            block_advantages.append(block_adv)
+            return {
+                'custody_weight': custody_weight,
+                'volume_weight': volume_weight,
+                'correlation_weight_to_blocks': float(correlation),
+                'winner_prediction_accuracy': winner_predictions_correct / len(self.test_results),
+                'rmse_block_prediction': math.sqrt(squared_error_sum / scored) if scored else 0,
+                'num_samples': len(self.test_results)
+            }
 
-            # Accuracy: did higher weight win?
-            if (weight_adv > 0 and block_adv > 0) or (weight_adv < 0 and block_adv < 0):
-                winner_predictions_correct += 1
-            elif weight_adv == 0 or block_adv == 0:
-                winner_predictions_correct += 0.5  # Partial credit for ties
-
-            # RMSE: how far off were we?
-            # Normalize by hashrate to get expected blocks
-            total_blocks = result.blocks_v27 + result.blocks_v26
-            if total_blocks > 0:
-                # Predict v27 blocks based on weight ratio
-                total_weight = v27_weight + v26_weight
-                if total_weight > 0:
-                    predicted_v27_blocks = (v27_weight / total_weight) * total_blocks
-                    error = (predicted_v27_blocks - result.blocks_v27) ** 2
-                    squared_errors.append(error)
-
-        # Calculate correlation
-        correlation = self.calculate_correlation(weight_advantages, block_advantages)
-
-        # Calculate accuracy
-        accuracy = winner_predictions_correct / len(self.test_results)
-
-        # Calculate RMSE
-        rmse = math.sqrt(sum(squared_errors) / len(squared_errors)) if squared_errors else 0
-
-        return {
-            'custody_weight': custody_weight,
-            'volume_weight': volume_weight,
-            'correlation_weight_to_blocks': correlation,
-            'winner_prediction_accuracy': accuracy,
-            'rmse_block_prediction': rmse,
-            'num_samples': len(self.test_results)
-        }
+        return self._evaluate_weight_grid([(custody_weight, volume_weight)])[0]
+
+    def _evaluate_weight_grid(self, weights: List[Tuple[float, float]]) -> List[Dict]:
+        """Evaluate several weight combinations at once, one row per (custody, volume) pair"""
+
+        cols = self._result_columns()
+        blocks_v27 = cols['blocks_v27']
+        custody_weights = np.array([w[0] for w in weights], dtype=np.float64)[:, None]
+        volume_weights = np.array([w[1] for w in weights], dtype=np.float64)[:, None]
+
+        # Consensus weights for every combination (rows) and result (columns)
+        v27_weight = custody_weights * cols['v27_custody_pct'] + volume_weights * cols['v27_volume_pct']
+        v26_weight = custody_weights * cols['v26_custody_pct'] + volume_weights * cols['v26_volume_pct']
+
+        weight_advantages = v27_weight - v26_weight  # v27 weight - v26 weight
+
+        # Accuracy: did higher weight win? Partial credit for ties. The
+        # block-side masks are shared by every row
+        same_winner = np.count_nonzero((weight_advantages > 0) & cols['v27_mined_more'], axis=1) + \
+                      np.count_nonzero((weight_advantages < 0) & cols['v26_mined_more'], axis=1)
+        tie = np.count_nonzero((weight_advantages == 0) | cols['blocks_tied'], axis=1)
+        winner_predictions_correct = same_winner + 0.5 * tie
+
+        # RMSE: predict v27 blocks from the weight ratio, only where
+        # blocks were mined and there is weight to split
+        total_blocks = cols['total_blocks']
+        total_weight = v27_weight + v26_weight
+        scored = (total_blocks > 0) & (total_weight > 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            squared_errors = ((v27_weight / total_weight) * total_blocks - blocks_v27) ** 2
+        squared_error_sums = np.where(scored, squared_errors, 0.0).sum(axis=1)
+        scored_counts = scored.sum(axis=1)
+
+        # Pearson correlation of each row of weight advantages against the block advantages
+        dw = weight_advantages - weight_advantages.mean(axis=1)[:, None]
+        cov = dw @ cols['block_advantages_centered']
+        var_w = np.einsum('ij,ij->i', dw, dw)
+        var_b = cols['block_advantages_ss']
+
+        num_samples = len(self.test_results)
+        results = []
+        for j, (custody_weight, volume_weight) in enumerate(weights):
+            if var_w[j] == 0 or var_b == 0:
+                correlation = 0.0
+            else:
+                correlation = float(cov[j] / (math.sqrt(var_w[j]) * math.sqrt(var_b)))
+
+            results.append({
+                'custody_weight': custody_weight,
+                'volume_weight': volume_weight,
+                'correlation_weight_to_blocks': correlation,
+                'winner_prediction_accuracy': float(winner_predictions_correct[j]) / num_samples,
+                'rmse_block_prediction': math.sqrt(squared_error_sums[j] / scored_counts[j]) if scored_counts[j] else 0,
+                'num_samples': num_samples
+            })
+        return results
 
     def optimize_weights(self) -> List[Dict]:
         """
@@ -276,15 +534,19 @@ class WeightOptimizer:
         print(f"\nTesting {len(self.weights_to_test)} weight combinations on {len(self.test_results)} samples...")
         print("=" * 80)
 
-        results = []
-        for custody_w, volume_w in self.weights_to_test:
-            metrics = self.evaluate_weights(custody_w, volume_w)
-            results.append(metrics)
+        if len(self.test_results) >= NUMBA_MIN_RESULTS and _numba_evaluate():
+            # The fused kernel avoids the N x W temporaries of the grid
+            results = [self.evaluate_weights(custody_w, volume_w)
+                       for custody_w, volume_w in self.weights_to_test]
+        else:
+            results = self._evaluate_weight_grid(self.weights_to_test)
 
-        # Sort by correlation (primary) and accuracy (secondary)
-        results.sort(key=lambda x: (x['correlation_weight_to_blocks'],
-                                    x['winner_prediction_accuracy']),
-                     reverse=True)
+        # Rank by correlation (primary) and accuracy (secondary), best first;
+        # lexsort is stable, so tied combinations keep their tested order
+        correlations = np.array([r['correlation_weight_to_blocks'] for r in results])
+        accuracies = np.array([r['winner_prediction_accuracy'] for r in results])
+        order = np.lexsort((-accuracies, -correlations))
+        results = [results[i] for i in order]
 
         return results
 
@@ -370,6 +632,9 @@ Examples:
 
   # Test custom weight combinations
   python3 weight_optimizer.py --results-dir ../test_results/ --custom-weights 0.75 0.25
+
+  # Reuse parsed results across runs
+  python3 weight_optimizer.py --results-dir ../test_results/ --cache-dir ~/.cache/warnet
         """
     )
 
@@ -393,13 +658,28 @@ Examples:
         help='Minimum number of samples required for analysis (default: 5)'
     )
 
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Parse result files in this many processes (default: 1, parse serially)'
+    )
+
+    parser.add_argument(
+        '--cache-dir',
+        type=str,
+        help='Cache parsed results in this directory and reuse them while the result files are unchanged '
+             '(default: no cache, parse every run)'
+    )
+
     args = parser.parse_args()
 
     # Create optimizer
     optimizer = WeightOptimizer()
 
     # Load test results
-    num_loaded = optimizer.load_test_results(args.results_dir)
+    num_loaded = optimizer.load_test_results(args.results_dir, cache_dir=args.cache_dir,
+                                             workers=args.workers)
 
     if num_loaded < args.min_samples:
         print(f"\nError: Insufficient samples ({num_loaded} < {args.min_samples})")
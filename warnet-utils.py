@@ -4,32 +4,120 @@ Warnet Utilities - Helper scripts for common operations
 """
 
 import sys
+import hashlib
 import json
-from warnet_test_framework import (
-    NetworkState, WarnetRPC, NetworkPartition, 
-    Monitor, ConfigLoader, logger
-)
+import os
+import re
+import subprocess
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+
+# warnet_test_framework is imported inside the commands that use it: it pulls
+# in yaml/subprocess and opens warnet_tests.log, which the usage text and
+# unknown-command paths don't need
+
+CONFIG_FILE = "test_config.yaml"
+
+# Node discovery is one RPC per node; with WARNET_STATE_CACHE=1 its result is
+# kept briefly so commands run back to back (list -> health -> mempool) don't
+# rediscover the network. Off by default: a redeploy inside the TTL would
+# otherwise reuse stale IPs and versions.
+STATE_CACHE_TTL = 30  # seconds
+
+_shared_state = None
+
+# Bare JSON integers, as printed by getblockcount and similar RPCs
+_JSON_INT_RE = re.compile(r'0|[1-9][0-9]*')
+
+
+def _state_cache_file(nodes):
+    """Per-user cache file for this config and node list, or None when caching is off"""
+    if os.environ.get("WARNET_STATE_CACHE") != "1":
+        return None
+    user = os.getuid() if hasattr(os, "getuid") else os.environ.get("USERNAME", "")
+    key = hashlib.sha1(json.dumps([str(Path(CONFIG_FILE).resolve()), list(nodes)]).encode())
+    return Path(tempfile.gettempdir()) / f"warnet_state_{user}_{key.hexdigest()[:16]}.json"
+
+
+def _load_cached_node_info(nodes):
+    """Return node info saved by a recent run for the same nodes, or None"""
+    cache_file = _state_cache_file(nodes)
+    if cache_file is None:
+        return None
+    from warnet_test_framework import NodeInfo, logger
+    try:
+        with open(cache_file) as f:
+            cached = json.load(f)
+        age = time.time() - cached['saved_at']
+        if cached['nodes'] != list(nodes) or not 0 <= age < STATE_CACHE_TTL:
+            return None
+        node_info = {name: NodeInfo(name, info['ip'], info['version'])
+                     for name, info in cached['node_info'].items()}
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    
+    logger.info(f"Using node info discovered {age:.0f}s ago ({cache_file})")
+    return node_info
+
+
+def _save_node_info(nodes, node_info):
+    """Persist discovered node info for the next few seconds of CLI use"""
+    cache_file = _state_cache_file(nodes)
+    if cache_file is None:
+        return
+    cached = {
+        'saved_at': time.time(),
+        'nodes': list(nodes),
+        'node_info': {name: {'ip': info.ip, 'version': info.version}
+                      for name, info in node_info.items()}
+    }
+    try:
+        with open(cache_file, 'w') as f:
+            json.dump(cached, f)
+    except OSError:
+        pass
+
+
+def _get_state(nodes):
+    """NetworkState for nodes, reusing discovery from this process or a recent run"""
+    from warnet_test_framework import NetworkState
+    global _shared_state
+    if _shared_state is not None and _shared_state.nodes == nodes:
+        return _shared_state
+    
+    node_info = _load_cached_node_info(nodes)
+    _shared_state = NetworkState(nodes, node_info=node_info)
+    if node_info is None and _shared_state.node_info:
+        _save_node_info(nodes, _shared_state.node_info)
+    return _shared_state
 
 
 def list_nodes(nodes):
     """List all nodes with their info"""
+    from warnet_test_framework import WarnetRPC
+    
     print("\n" + "="*80)
     print("WARNET NETWORK STATUS")
     print("="*80)
     
-    state = NetworkState(nodes)
+    state = _get_state(nodes)
     
     print(f"\nTotal Nodes: {len(state.nodes)}")
     print("-"*80)
     print(f"{'Node':<15} {'IP Address':<20} {'Version':<20} {'Height':<10} {'Peers':<10}")
     print("-"*80)
     
-    for node in state.nodes:
-        info = state.node_info.get(node)
-        if info:
-            height = WarnetRPC.get_block_count(node)
-            peers = len(WarnetRPC.get_peer_info(node))
-            print(f"{node:<15} {info.ip:<20} {info.version:<20} {height:<10} {peers:<10}")
+    known = [node for node in state.nodes if state.node_info.get(node)]
+    status = WarnetRPC.batch_get(
+        known, lambda node: (WarnetRPC.get_block_count(node), len(WarnetRPC.get_peer_info(node)))
+    )
+    
+    for node in known:
+        info = state.node_info[node]
+        height, peers = status[node]
+        print(f"{node:<15} {info.ip:<20} {info.version:<20} {height:<10} {peers:<10}")
     
     print("="*80)
 
@@ -40,7 +128,7 @@ def check_network_health(nodes):
     print("NETWORK HEALTH CHECK")
     print("="*80)
     
-    state = NetworkState(nodes)
+    state = _get_state(nodes)
     snapshot = state.snapshot()
     
     print(f"\nTimestamp: {snapshot.timestamp}")
@@ -50,12 +138,9 @@ def check_network_health(nodes):
     if snapshot.fork_detected:
         print("\n⚠️  WARNING: Network is forked!")
         print("\nChain tips:")
-        tips = {}
+        tips = defaultdict(list)
         for node, data in snapshot.nodes.items():
-            tip = (data['height'], data['best_hash'][:12])
-            if tip not in tips:
-                tips[tip] = []
-            tips[tip].append(node)
+            tips[(data['height'], data['best_hash'][:12])].append(node)
         
         for (height, hash_prefix), node_list in tips.items():
             print(f"\n  Height {height} ({hash_prefix}...):")
@@ -82,11 +167,13 @@ def check_network_health(nodes):
 
 def show_mempool_status(nodes):
     """Show mempool status for all nodes"""
+    from warnet_test_framework import WarnetRPC
+    
     print("\n" + "="*80)
     print("MEMPOOL STATUS")
     print("="*80)
     
-    state = NetworkState(nodes)
+    state = _get_state(nodes)
     
     print(f"\n{'Node':<15} {'Transactions':<15} {'Size (bytes)':<15} {'Fee Rate':<15}")
     print("-"*80)
@@ -94,8 +181,9 @@ def show_mempool_status(nodes):
     total_txs = 0
     total_bytes = 0
     
+    mempools = WarnetRPC.batch_get(state.nodes, WarnetRPC.get_mempool_info)
     for node in state.nodes:
-        mempool = WarnetRPC.get_mempool_info(node)
+        mempool = mempools[node]
         size = mempool.get('size', 0)
         bytes_size = mempool.get('bytes', 0)
         min_fee = mempool.get('mempoolminfee', 0)
@@ -112,16 +200,18 @@ def show_mempool_status(nodes):
 
 def force_reconnect(nodes):
     """Force reconnect all nodes"""
+    from warnet_test_framework import NetworkPartition, WarnetRPC
+    
     print("\n" + "="*80)
     print("RECONNECTING NETWORK")
     print("="*80)
     
-    state = NetworkState(nodes)
+    state = _get_state(nodes)
     partition = NetworkPartition(state)
     
     print("\nClearing all bans...")
+    WarnetRPC.batch_get(nodes, WarnetRPC.clear_banned)
     for node in nodes:
-        WarnetRPC.clear_banned(node)
         print(f"  ✓ Cleared bans on {node}")
     
     print("\nForcing connections...")
@@ -140,11 +230,13 @@ def force_reconnect(nodes):
 
 def partition_network(nodes, group1_indices, group2_indices):
     """Partition network into two groups"""
+    from warnet_test_framework import NetworkPartition
+    
     print("\n" + "="*80)
     print("PARTITIONING NETWORK")
     print("="*80)
     
-    state = NetworkState(nodes)
+    state = _get_state(nodes)
     partition = NetworkPartition(state)
     
     group1 = [nodes[i] for i in group1_indices if i < len(nodes)]
@@ -162,11 +254,13 @@ def partition_network(nodes, group1_indices, group2_indices):
 
 def monitor_live(nodes, duration=300):
     """Monitor network live"""
+    from warnet_test_framework import Monitor
+    
     print("\n" + "="*80)
     print(f"LIVE MONITORING ({duration}s)")
     print("="*80)
     
-    state = NetworkState(nodes)
+    state = _get_state(nodes)
     monitor = Monitor(state)
     
     print("\nMonitoring started. Press Ctrl+C to stop early.\n")
@@ -198,14 +292,22 @@ def monitor_live(nodes, duration=300):
 
 def compare_versions(nodes, version_a_prefix, version_b_prefix):
     """Compare behavior between two version groups"""
+    from warnet_test_framework import WarnetRPC
+    
     print("\n" + "="*80)
     print("VERSION COMPARISON")
     print("="*80)
     
-    state = NetworkState(nodes)
+    state = _get_state(nodes)
     
-    group_a = [n for n, info in state.node_info.items() if version_a_prefix in info.version]
-    group_b = [n for n, info in state.node_info.items() if version_b_prefix in info.version]
+    # One pass over the nodes; a version matching both prefixes still lands in both groups
+    group_a = []
+    group_b = []
+    for n, info in state.node_info.items():
+        if version_a_prefix in info.version:
+            group_a.append(n)
+        if version_b_prefix in info.version:
+            group_b.append(n)
     
     print(f"\nVersion A ({version_a_prefix}): {len(group_a)} nodes")
     print(f"Version B ({version_b_prefix}): {len(group_b)} nodes")
@@ -214,8 +316,9 @@ def compare_versions(nodes, version_a_prefix, version_b_prefix):
     print("HEIGHTS")
     print("-"*80)
     
-    heights_a = [WarnetRPC.get_block_count(n) for n in group_a]
-    heights_b = [WarnetRPC.get_block_count(n) for n in group_b]
+    heights = WarnetRPC.batch_get(group_a + group_b, WarnetRPC.get_block_count)
+    heights_a = [heights[n] for n in group_a]
+    heights_b = [heights[n] for n in group_b]
     
     print(f"Version A: {heights_a}")
     print(f"Version B: {heights_b}")
@@ -224,10 +327,11 @@ def compare_versions(nodes, version_a_prefix, version_b_prefix):
     print("MEMPOOLS")
     print("-"*80)
     
+    mempools = WarnetRPC.batch_get(group_a + group_b, WarnetRPC.get_mempool_info)
     for group_name, group_nodes in [("Version A", group_a), ("Version B", group_b)]:
         total_txs = 0
         for node in group_nodes:
-            mempool = WarnetRPC.get_mempool_info(node)
+            mempool = mempools[node]
             total_txs += mempool.get('size', 0)
         avg_txs = total_txs / len(group_nodes) if group_nodes else 0
         print(f"{group_name}: avg {avg_txs:.0f} transactions per node")
@@ -241,8 +345,6 @@ def debug_rpc(nodes, command="getblockcount"):
     print(f"DEBUG: Testing RPC command '{command}'")
     print("="*80)
     
-    import subprocess
-    
     for node in nodes[:3]:  # Test first 3 nodes
         print(f"\n{node}:")
         print("-"*80)
@@ -258,20 +360,26 @@ def debug_rpc(nodes, command="getblockcount"):
             
             # Try to parse
             if result.stdout:
-                try:
-                    import json
-                    parsed = json.loads(result.stdout)
-                    print(f"Parsed as JSON: {parsed}")
-                except json.JSONDecodeError as e:
-                    print(f"JSON parse error: {e}")
-                    print(f"Raw output type: {type(result.stdout)}")
-                    print(f"Raw output repr: {repr(result.stdout)}")
+                output = result.stdout.strip()
+                if _JSON_INT_RE.fullmatch(output):
+                    print(f"Parsed as JSON: {int(output)}")
+                else:
+                    try:
+                        parsed = json.loads(result.stdout)
+                        print(f"Parsed as JSON: {parsed}")
+                    except json.JSONDecodeError as e:
+                        print(f"JSON parse error: {e}")
+                        print(f"Raw output type: {type(result.stdout)}")
+                        print(f"Raw output repr: {repr(result.stdout)}")
         except Exception as e:
             print(f"Error: {e}")
     
     print("\n" + "="*80)
 
 
+COMMANDS = ("list", "health", "mempool", "reconnect", "partition", "monitor", "compare", "debug")
+
+
 def main():
     """Main CLI entry point"""
     if len(sys.argv) < 2:
@@ -293,14 +401,23 @@ def main():
         print("  python warnet_utils.py monitor 600")
         print("  python warnet_utils.py compare '29.0' '28.1'")
         print("  python warnet_utils.py debug")
+        print(f"\nSet WARNET_STATE_CACHE=1 to reuse node discovery for {STATE_CACHE_TTL}s between commands")
+        sys.exit(1)
+    
+    command = sys.argv[1].lower()
+    
+    # Reject unknown commands before loading the framework and config
+    if command not in COMMANDS:
+        print(f"Unknown command: {command}")
+        print("Run without arguments to see usage")
         sys.exit(1)
     
+    from warnet_test_framework import ConfigLoader
+    
     # Load config to get nodes
-    config = ConfigLoader.load("test_config.yaml")
+    config = ConfigLoader.load(CONFIG_FILE)
     nodes = config.get('network', {}).get('nodes', [f"tank-{i:04d}" for i in range(8)])
     
-    command = sys.argv[1].lower()
-    
     if command == "list":
         list_nodes(nodes)
     
@@ -344,11 +461,6 @@ def main():
     elif command == "debug":
         rpc_command = sys.argv[2] if len(sys.argv) > 2 else "getblockcount"
         debug_rpc(nodes, rpc_command)
-    
-    else:
-        print(f"Unknown command: {command}")
-        print("Run without arguments to see usage")
-        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -3,12 +3,94 @@
 Warnet Visualizer - Generate charts and graphs from test results
 """
 
+import io
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime
-from typing import List, Dict
-import statistics
+from functools import cached_property
+from itertools import islice
+from typing import List, Dict, Optional, TextIO
+
+# orjson parses large number-heavy reports considerably faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Reports at least this large are streamed with ijson (if installed) for the
+# commands that only read a few fields per test; below it a full decode is faster
+STREAM_PARSE_MIN_BYTES = 8 * 1024 * 1024
+
+# Threads used to build the per-test height charts. Chart building is pure
+# Python string work that holds the GIL, so threads only pay off on a
+# free-threaded interpreter; serial by default
+HEIGHT_CHART_WORKERS = 1
+
+# Per-test fields read by the heights and compare commands, as dotted paths
+CHART_FIELDS = (
+    'name',
+    'duration',
+    'fork_detected',
+    'metrics.summary_stats.height_progression',
+)
+
+
+# Importing NumPy takes longer than the pure Python rasterization loop saves
+# until a chart has this many points, so smaller charts never pay for it
+NUMPY_MIN_POINTS = 500_000
+
+_np = None
+
+
+def _numpy():
+    """Return the numpy module, or False if it is not installed"""
+    global _np
+    if _np is None:
+        try:
+            import numpy
+            _np = numpy
+        except ImportError:
+            _np = False
+    return _np
+
+
+# Importing numba costs more than its loop saves over the NumPy scatter
+# until a chart has millions of points
+NUMBA_MIN_POINTS = 10_000_000
+
+_raster_kernel = None
+
+
+def _numba_raster():
+    """Return the compiled rasterization kernel, or False if numba is unavailable"""
+    global _raster_kernel
+    if _raster_kernel is not None:
+        return _raster_kernel
+    
+    try:
+        from numba import njit
+    except ImportError:
+        _raster_kernel = False
+        return _raster_kernel
+    
+    @njit(cache=True, nogil=True)
+    def raster(ys, min_val, max_val, width, height, grid, symbol_code):
+        n = ys.size
+        last = max(n - 1, 1)
+        for i in range(n):
+            y_row = int((ys[i] - min_val) / (max_val - min_val) * height)
+            x_col = int(i / last * (width - 13))
+            if 0 <= x_col < grid.shape[1] and 0 <= y_row <= height:
+                grid[height - y_row, x_col] = symbol_code
+    
+    _raster_kernel = raster
+    return _raster_kernel
 
 
 class ASCIIGraph:
@@ -42,32 +124,44 @@ class ASCIIGraph:
         lines = [title]
         lines.append("=" * width)
         
-        # Y-axis labels and data points
-        for row in range(height, -1, -1):
-            # Calculate the value this row represents
-            value = min_val + (max_val - min_val) * (row / height)
-            
-            # Y-axis label
-            line = f"{value:8.1f} │"
-            
-            # Plot points for this row
-            char_line = [' '] * (width - 12)
-            
-            for series_name, series_data in data.items():
-                symbol = '*' if len(data) == 1 else series_name[0].upper()
-                
+        # Pick each series' plot symbol once; a lone series is drawn with '*'
+        if len(data) == 1:
+            series = [('*', next(iter(data.values())))]
+        else:
+            series = [(name[0].upper(), points) for name, points in data.items()]
+        
+        # Large charts are rasterized in one pass with NumPy, as long as every
+        # symbol is one character ('ß'.upper() is 'SS')
+        np = False
+        if len(all_values) >= NUMPY_MIN_POINTS and all(len(symbol) == 1 for symbol, _ in series):
+            np = _numpy()
+        if np:
+            grid = ASCIIGraph._rasterize(np, series, min_val, max_val, width, height)
+        else:
+            # Map every point to its cell once; grid[0] is the top row
+            grid = [[' '] * (width - 12) for _ in range(height + 1)]
+            for symbol, series_data in series:
+                last = max(len(series_data) - 1, 1)
                 for i, (x, y) in enumerate(series_data):
                     # Map y value to row
                     y_normalized = (y - min_val) / (max_val - min_val)
                     y_row = int(y_normalized * height)
                     
                     # Map x to column
-                    x_col = int((i / max(len(series_data) - 1, 1)) * (width - 13))
+                    x_col = int((i / last) * (width - 13))
                     
-                    if y_row == row and 0 <= x_col < len(char_line):
-                        char_line[x_col] = symbol
+                    if 0 <= y_row <= height and 0 <= x_col < width - 12:
+                        grid[height - y_row][x_col] = symbol
+        
+        # Y-axis labels and data points
+        for row in range(height, -1, -1):
+            # Calculate the value this row represents
+            value = min_val + (max_val - min_val) * (row / height)
+            
+            # Y-axis label (%-formatting beats an f-string with a format spec here)
+            line = '%8.1f │' % value
             
-            line += ''.join(char_line)
+            line += ''.join(grid[height - row])
             lines.append(line)
         
         # X-axis
@@ -81,6 +175,38 @@ class ASCIIGraph:
         
         return '\n'.join(lines)
     
+    @staticmethod
+    def _rasterize(np, series: List[tuple], min_val: float, max_val: float,
+                   width: int, height: int):
+        """
+        Scatter every (symbol, points) series into a (height + 1) x (width - 12)
+        character grid, top row first, using the same row/column mapping as
+        the Python loop
+        """
+        # Code points in a uint32 grid, which views directly as one-character strings
+        grid = np.full((height + 1, max(width - 12, 0)), ord(' '), dtype=np.uint32)
+        total_points = sum(len(series_data) for symbol, series_data in series)
+        kernel = _numba_raster() if total_points >= NUMBA_MIN_POINTS else False
+        
+        for symbol, series_data in series:
+            n = len(series_data)
+            if not n:
+                continue
+            
+            ys = np.fromiter((y for x, y in series_data), dtype=np.float64, count=n)
+            if kernel:
+                kernel(ys, min_val, max_val, width, height, grid, ord(symbol))
+                continue
+            
+            x_cols = (np.arange(n) / max(n - 1, 1) * (width - 13)).astype(np.intp)
+            y_rows = ((ys - min_val) / (max_val - min_val) * height).astype(np.intp)
+            
+            # Bounds check for every point at once, then one scatter per series
+            valid = (x_cols >= 0) & (x_cols < width - 12) & (y_rows >= 0) & (y_rows <= height)
+            grid[height - y_rows[valid], x_cols[valid]] = ord(symbol)
+        
+        return grid.view('<U1')
+    
     @staticmethod
     def bar_chart(data: Dict[str, float], title: str, width: int = 60):
         """
@@ -93,13 +219,22 @@ class ASCIIGraph:
         lines = [title]
         lines.append("=" * width)
         
-        max_val = max(data.values()) if data.values() else 1
-        max_label_len = max(len(label) for label in data.keys())
+        # Largest value and longest label in one pass
+        max_val = None
+        max_label_len = 0
+        for label, value in data.items():
+            if max_val is None or value > max_val:
+                max_val = value
+            if len(label) > max_label_len:
+                max_label_len = len(label)
+        if max_val == 0:
+            max_val = 1  # all-zero data, e.g. no test detected a fork
         
         for label, value in data.items():
             bar_width = int((value / max_val) * (width - max_label_len - 10))
             bar = "█" * bar_width
-            lines.append(f"{label:>{max_label_len}} │ {bar} {value:.1f}")
+            # rjust + concatenation skips parsing the nested width spec every row
+            lines.append(label.rjust(max_label_len) + " │ " + bar + " " + format(value, '.1f'))
         
         return '\n'.join(lines)
 
@@ -108,130 +243,204 @@ class ReportGenerator:
     """Generate comprehensive reports from test results"""
     
     def __init__(self, report_file: str):
-        with open(report_file, 'r') as f:
-            self.data = json.load(f)
+        with open(report_file, 'rb') as f:
+            raw = f.read()
+        self.data = None
+        if orjson is not None:
+            try:
+                self.data = orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                pass  # json accepts NaN/Infinity and big ints, and reports errors as before
+        if self.data is None:
+            self.data = json.loads(raw)
         self.timestamp = self.data.get('timestamp', 'Unknown')
         self.tests = self.data.get('tests', [])
         self.network = self.data.get('network', {})
     
-    def generate_text_report(self) -> str:
-        """Generate detailed text report"""
-        lines = []
+    @cached_property
+    def durations(self) -> Dict[str, float]:
+        """Duration of each test, by test name"""
+        return {test['name']: test.get('duration', 0) for test in self.tests}
+    
+    @cached_property
+    def total_blocks_by_test(self) -> Dict[str, int]:
+        """Blocks produced across all nodes, by test name, for tests that produced any"""
+        totals = {}
+        for test in self.tests:
+            metrics = test.get('metrics', {})
+            height_prog = metrics.get('summary_stats', {}).get('height_progression', {})
+            total_blocks = sum(data.get('blocks_produced', 0) for data in height_prog.values())
+            if total_blocks > 0:
+                totals[test['name']] = total_blocks
+        return totals
+    
+    @classmethod
+    def from_report_minimal(cls, report_file: str, fields=CHART_FIELDS) -> 'ReportGenerator':
+        """
+        Stream the report's tests with ijson, keeping only the given dotted
+        field paths of each test, so only one full test is in memory at a time.
+        The timestamp and network sections are not loaded.
+        """
+        tests = []
+        with open(report_file, 'rb') as f:
+            for test in ijson.items(f, 'tests.item', use_float=True):
+                kept = {}
+                for field in fields:
+                    *parents, leaf = field.split('.')
+                    src, dst = test, kept
+                    for key in parents:
+                        src = src.get(key)
+                        if not isinstance(src, dict):
+                            break
+                        dst = dst.setdefault(key, {})
+                    else:
+                        if leaf in src:
+                            dst[leaf] = src[leaf]
+                tests.append(kept)
+        
+        generator = cls.__new__(cls)
+        generator.data = {'tests': tests}
+        generator.timestamp = 'Unknown'
+        generator.tests = tests
+        generator.network = {}
+        return generator
+    
+    def generate_text_report(self, out: Optional[TextIO] = None) -> Optional[str]:
+        """
+        Generate detailed text report
+        Returns the report as a string, or writes it to out and returns None
+        """
+        buf = io.StringIO() if out is None else None
+        w = (buf if out is None else out).write
         
         # Header
-        lines.append("=" * 80)
-        lines.append("WARNET TEST RESULTS - DETAILED REPORT".center(80))
-        lines.append("=" * 80)
-        lines.append(f"\nGenerated: {self.timestamp}")
-        lines.append(f"Network: {len(self.network.get('nodes', []))} nodes")
-        lines.append(f"Total Tests: {len(self.tests)}")
+        w("=" * 80 + "\n")
+        w("WARNET TEST RESULTS - DETAILED REPORT".center(80) + "\n")
+        w("=" * 80 + "\n")
+        w(f"\nGenerated: {self.timestamp}\n")
+        w(f"Network: {len(self.network.get('nodes', []))} nodes\n")
+        w(f"Total Tests: {len(self.tests)}\n")
         
         # Summary statistics
-        lines.append("\n" + "=" * 80)
-        lines.append("SUMMARY")
-        lines.append("=" * 80)
+        w("\n" + "=" * 80 + "\n")
+        w("SUMMARY\n")
+        w("=" * 80 + "\n")
         
-        forks_detected = sum(1 for test in self.tests if test.get('fork_detected'))
-        errors = sum(1 for test in self.tests if test.get('error'))
-        total_duration = sum(test.get('duration', 0) for test in self.tests)
+        # One pass over the tests for every summary figure
+        forks_detected = 0
+        errors = 0
+        total_duration = 0
+        for test in self.tests:
+            duration = test.get('duration', 0)
+            if test.get('fork_detected'):
+                forks_detected += 1
+            if test.get('error'):
+                errors += 1
+            total_duration += duration
         
-        lines.append(f"\nTests with Forks:  {forks_detected}/{len(self.tests)}")
-        lines.append(f"Tests with Errors: {errors}/{len(self.tests)}")
-        lines.append(f"Total Duration:    {total_duration:.1f}s ({total_duration/60:.1f}m)")
+        w(f"\nTests with Forks:  {forks_detected}/{len(self.tests)}\n")
+        w(f"Tests with Errors: {errors}/{len(self.tests)}\n")
+        w(f"Total Duration:    {total_duration:.1f}s ({total_duration/60:.1f}m)\n")
         
         # Test durations bar chart
         if self.tests:
-            lines.append("\n" + "-" * 80)
-            lines.append("Test Durations")
-            lines.append("-" * 80)
-            durations = {test['name']: test.get('duration', 0) for test in self.tests}
-            lines.append(ASCIIGraph.bar_chart(durations, "", width=70))
+            w("\n" + "-" * 80 + "\n")
+            w("Test Durations\n")
+            w("-" * 80 + "\n")
+            w(ASCIIGraph.bar_chart(self.durations, "", width=70))
+            w("\n")
         
         # Detailed test results
-        lines.append("\n" + "=" * 80)
-        lines.append("DETAILED TEST RESULTS")
-        lines.append("=" * 80)
+        w("\n" + "=" * 80 + "\n")
+        w("DETAILED TEST RESULTS\n")
+        w("=" * 80 + "\n")
         
         for i, test in enumerate(self.tests, 1):
-            lines.append(f"\n{i}. {test['name']}")
-            lines.append("-" * 80)
-            lines.append(f"Duration:      {test.get('duration', 0):.1f}s")
-            lines.append(f"Start Time:    {test.get('start_time', 'N/A')}")
-            lines.append(f"End Time:      {test.get('end_time', 'N/A')}")
-            lines.append(f"Fork Detected: {'✓ YES' if test.get('fork_detected') else '✗ NO'}")
+            w(f"\n{i}. {test['name']}\n")
+            w("-" * 80 + "\n")
+            w(f"Duration:      {test.get('duration', 0):.1f}s\n")
+            w(f"Start Time:    {test.get('start_time', 'N/A')}\n")
+            w(f"End Time:      {test.get('end_time', 'N/A')}\n")
+            w(f"Fork Detected: {'✓ YES' if test.get('fork_detected') else '✗ NO'}\n")
             
             if test.get('error'):
-                lines.append(f"ERROR:         {test['error']}")
+                w(f"ERROR:         {test['error']}\n")
                 continue
             
             # Metrics
             metrics = test.get('metrics', {})
+            summary = metrics.get('summary_stats', {})
             
             # Fork information
             if test.get('fork_detected'):
                 fork_point = metrics.get('fork_point')
                 if fork_point:
-                    lines.append(f"Fork Point:    Block {fork_point}")
+                    w(f"Fork Point:    Block {fork_point}\n")
                 
-                summary = metrics.get('summary_stats', {})
                 if summary.get('fork_duration'):
-                    lines.append(f"Fork Duration: {summary['fork_duration']:.1f}s")
+                    w(f"Fork Duration: {summary['fork_duration']:.1f}s\n")
                 if summary.get('fork_count'):
-                    lines.append(f"Fork Events:   {summary['fork_count']}")
+                    w(f"Fork Events:   {summary['fork_count']}\n")
             
             # Block production
-            height_prog = metrics.get('summary_stats', {}).get('height_progression', {})
+            height_prog = summary.get('height_progression', {})
             if height_prog:
-                lines.append("\nBlock Production:")
+                w("\nBlock Production:\n")
                 total_blocks = 0
                 for node, data in height_prog.items():
                     blocks = data.get('blocks_produced', 0)
                     total_blocks += blocks
-                    lines.append(f"  {node}: {blocks} blocks ({data.get('start', 0)} → {data.get('end', 0)})")
-                lines.append(f"  TOTAL: {total_blocks} blocks")
+                    w(f"  {node}: {blocks} blocks ({data.get('start', 0)} → {data.get('end', 0)})\n")
+                w(f"  TOTAL: {total_blocks} blocks\n")
             
             # Mempool stats
-            mempool_stats = metrics.get('summary_stats', {}).get('mempool_stats', {})
+            mempool_stats = summary.get('mempool_stats', {})
             if mempool_stats:
-                lines.append("\nMempool Statistics:")
-                for node, stats in list(mempool_stats.items())[:4]:  # Show first 4
+                w("\nMempool Statistics:\n")
+                for node, stats in islice(mempool_stats.items(), 4):  # Show first 4
                     avg = stats.get('avg_size', 0)
                     max_size = stats.get('max_size', 0)
-                    lines.append(f"  {node}: avg={avg:.0f}, max={max_size}")
+                    w(f"  {node}: avg={avg:.0f}, max={max_size}\n")
             
             # Reorg analysis
             reorg = metrics.get('reorg_analysis', {})
-            reorgs = [node for node, data in reorg.items() if data.get('occurred')]
-            if reorgs:
-                lines.append(f"\nReorganizations: {len(reorgs)} nodes")
-                for node in reorgs[:5]:  # Show first 5
-                    data = reorg[node]
-                    lines.append(f"  {node}: {data.get('pre_height', 0)} → {data.get('post_height', 0)}")
+            reorg_count = 0
+            reorgs = []  # first 5 only
+            for node, data in reorg.items():
+                if data.get('occurred'):
+                    reorg_count += 1
+                    if reorg_count <= 5:
+                        reorgs.append((node, data))
+            if reorg_count:
+                w(f"\nReorganizations: {reorg_count} nodes\n")
+                for node, data in reorgs:
+                    w(f"  {node}: {data.get('pre_height', 0)} → {data.get('post_height', 0)}\n")
             
             # Pre/Post snapshots
             pre_snap = test.get('pre_snapshot', {})
             post_snap = test.get('post_snapshot', {})
             
             if pre_snap.get('unique_tips') != post_snap.get('unique_tips'):
-                lines.append(f"\nChain Tips: {pre_snap.get('unique_tips', 0)} → {post_snap.get('unique_tips', 0)}")
+                w(f"\nChain Tips: {pre_snap.get('unique_tips', 0)} → {post_snap.get('unique_tips', 0)}\n")
         
         # Network information
-        lines.append("\n" + "=" * 80)
-        lines.append("NETWORK CONFIGURATION")
-        lines.append("=" * 80)
+        w("\n" + "=" * 80 + "\n")
+        w("NETWORK CONFIGURATION\n")
+        w("=" * 80 + "\n")
         
         node_info = self.network.get('node_info', {})
         if node_info:
-            lines.append(f"\n{'Node':<15} {'IP Address':<20} {'Version':<20}")
-            lines.append("-" * 80)
-            for node, info in node_info.items():
-                lines.append(f"{node:<15} {info.get('ip', 'N/A'):<20} {info.get('version', 'N/A'):<20}")
+            w(f"\n{'Node':<15} {'IP Address':<20} {'Version':<20}\n")
+            w("-" * 80 + "\n")
+            row_fmt = "{:<15} {:<20} {:<20}\n".format
+            w(''.join([row_fmt(node, info.get('ip', 'N/A'), info.get('version', 'N/A'))
+                       for node, info in node_info.items()]))
         
-        lines.append("\n" + "=" * 80)
-        lines.append("END OF REPORT")
-        lines.append("=" * 80)
+        w("\n" + "=" * 80 + "\n")
+        w("END OF REPORT\n")
+        w("=" * 80)
         
-        return '\n'.join(lines)
+        return buf.getvalue() if buf is not None else None
     
     def generate_height_progression_chart(self, test_name: str = None):
         """Generate height progression chart for a specific test"""
@@ -243,67 +452,75 @@ class ReportGenerator:
         else:
             tests_to_chart = self.tests
         
-        for test in tests_to_chart:
-            print(f"\nHeight Progression: {test['name']}")
-            print("=" * 80)
-            
-            metrics = test.get('metrics', {})
-            height_prog = metrics.get('summary_stats', {}).get('height_progression', {})
-            
-            if not height_prog:
-                print("No height progression data available")
-                continue
-            
-            # Create chart data (simplified - would need time series for real chart)
-            data = {}
-            for node, prog in height_prog.items():
-                start = prog.get('start', 0)
-                end = prog.get('end', 0)
-                blocks = prog.get('blocks_produced', 0)
-                # Create simple progression
-                data[node] = [(0, start), (1, end)]
-            
-            chart = ASCIIGraph.line_chart(data, f"Block Heights - {test['name']}", height=15)
-            print(chart)
-            print()
+        # Charts are independent, so they are built in parallel and written
+        # out in test order with a single write
+        if len(tests_to_chart) > 1 and HEIGHT_CHART_WORKERS > 1:
+            with ThreadPoolExecutor(max_workers=HEIGHT_CHART_WORKERS) as executor:
+                charts = list(executor.map(self._height_progression_chart, tests_to_chart))
+        else:
+            charts = [self._height_progression_chart(test) for test in tests_to_chart]
+        
+        sys.stdout.write(''.join(charts))
+    
+    def _height_progression_chart(self, test: Dict) -> str:
+        """Build the height progression section for one test"""
+        parts = [f"\nHeight Progression: {test['name']}\n", "=" * 80 + "\n"]
+        
+        metrics = test.get('metrics', {})
+        height_prog = metrics.get('summary_stats', {}).get('height_progression', {})
+        
+        if not height_prog:
+            parts.append("No height progression data available\n")
+            return ''.join(parts)
+        
+        # Create chart data (simplified - would need time series for real chart)
+        data = {}
+        for node, prog in height_prog.items():
+            start = prog.get('start', 0)
+            end = prog.get('end', 0)
+            blocks = prog.get('blocks_produced', 0)
+            # Create simple progression
+            data[node] = [(0, start), (1, end)]
+        
+        parts.append(ASCIIGraph.line_chart(data, f"Block Heights - {test['name']}", height=15))
+        parts.append("\n\n")
+        return ''.join(parts)
     
     def generate_comparison_chart(self):
         """Generate comparison chart across all tests"""
-        print("\n" + "=" * 80)
-        print("TEST COMPARISON")
-        print("=" * 80)
+        # Collect the output and write it once rather than print line by line
+        parts = []
+        out = parts.append
+        
+        out("\n" + "=" * 80 + "\n")
+        out("TEST COMPARISON\n")
+        out("=" * 80 + "\n")
         
         # Fork detection comparison
         fork_data = {}
         for test in self.tests:
             fork_data[test['name']] = 1.0 if test.get('fork_detected') else 0.0
         
-        print("\nFork Detection (1=Yes, 0=No):")
-        print(ASCIIGraph.bar_chart(fork_data, "", width=70))
+        out("\nFork Detection (1=Yes, 0=No):\n")
+        out(ASCIIGraph.bar_chart(fork_data, "", width=70) + "\n")
         
         # Duration comparison
-        duration_data = {test['name']: test.get('duration', 0) for test in self.tests}
-        print("\nTest Durations (seconds):")
-        print(ASCIIGraph.bar_chart(duration_data, "", width=70))
+        out("\nTest Durations (seconds):\n")
+        out(ASCIIGraph.bar_chart(self.durations, "", width=70) + "\n")
         
         # Block production comparison
-        blocks_data = {}
-        for test in self.tests:
-            metrics = test.get('metrics', {})
-            height_prog = metrics.get('summary_stats', {}).get('height_progression', {})
-            total_blocks = sum(data.get('blocks_produced', 0) for data in height_prog.values())
-            if total_blocks > 0:
-                blocks_data[test['name']] = total_blocks
+        blocks_data = self.total_blocks_by_test
         
         if blocks_data:
-            print("\nTotal Blocks Produced:")
-            print(ASCIIGraph.bar_chart(blocks_data, "", width=70))
+            out("\nTotal Blocks Produced:\n")
+            out(ASCIIGraph.bar_chart(blocks_data, "", width=70) + "\n")
+        
+        sys.stdout.write(''.join(parts))
     
     def save_text_report(self, output_file: str):
         """Save text report to file"""
-        report = self.generate_text_report()
         with open(output_file, 'w') as f:
-            f.write(report)
+            self.generate_text_report(out=f)
         print(f"Report saved to: {output_file}")
 
 
@@ -330,10 +547,18 @@ def main():
         print(f"Error: Report file '{report_file}' not found")
         sys.exit(1)
     
-    generator = ReportGenerator(report_file)
-    
     command = sys.argv[2].lower() if len(sys.argv) > 2 else "text"
     
+    generator = None
+    if (command in ("heights", "compare") and ijson is not None
+            and Path(report_file).stat().st_size >= STREAM_PARSE_MIN_BYTES):
+        try:
+            generator = ReportGenerator.from_report_minimal(report_file)
+        except ijson.JSONError:
+            pass  # e.g. NaN values, which json accepts; fall back to a full decode
+    if generator is None:
+        generator = ReportGenerator(report_file)
+    
     if command == "text":
         print(generator.generate_text_report())
     
@@ -3,18 +3,34 @@ Warnet Bitcoin Fork Testing Framework - Advanced Edition
 Complete testing suite with visualization, analysis, and reporting
 """
 
+import atexit
+import base64
+import heapq
+import http.client
 import subprocess
+import sys
 import json
+import os
+import re
+import shelve
+import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Callable, Any
 from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
 import logging
 from pathlib import Path
-import yaml
+from array import array
 from collections import defaultdict
-import statistics
+
+# orjson decodes RPC output (peer lists, mempools) and encodes the detailed report faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Configure logging
 logging.basicConfig(
@@ -27,10 +43,54 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+_BAR60 = "=" * 60
+_BAR80 = "=" * 80
+_DASH80 = "-" * 80
+
+# Opt-in on-disk block hash cache shared across runs (WARNET_PERSIST_CACHE=1).
+# Only tip-verified entries are written; the version suffix retires caches
+# written before that check existed.
+BLOCK_HASH_CACHE_FILE = Path(tempfile.gettempdir()) / "warnet_block_hashes.v2"
+
+# Bare block/tx hash as printed by the CLI
+_HEX64_RE = re.compile(r'\A[0-9a-fA-F]{64}\Z')
+
+
+def _json_loads(data):
+    """Decode JSON, preferring orjson; json still handles what orjson rejects (NaN, >64-bit ints)"""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def _json_dumps(obj, compact: bool = False) -> bytes:
+    """JSON as bytes (indented unless compact), preferring orjson; json covers what orjson rejects (>64-bit ints)"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj) if compact else orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            pass
+    if compact:
+        return json.dumps(obj, separators=(',', ':')).encode()
+    return json.dumps(obj, indent=2).encode()
+
+
+def _mean(total, count):
+    """Mean from a running sum; like statistics.mean on ints it is an int when exact, else a float"""
+    if isinstance(total, int):
+        quotient, remainder = divmod(total, count)
+        return quotient if remainder == 0 else total / count
+    return total / count
+
 
 @dataclass
 class NodeInfo:
     """Information about a Warnet node"""
+    # Explicit slots since dataclass(slots=True) needs Python 3.10
+    __slots__ = ('name', 'ip', 'version')
     name: str
     ip: str
     version: str
@@ -61,29 +121,164 @@ class TestResult:
 
 class WarnetRPC:
     """Wrapper for Warnet Bitcoin RPC calls with retry logic"""
+
+    # Each RPC is a `warnet` subprocess, so fan-out across nodes is bounded
+    # by spawn cost rather than the GIL; cap concurrent subprocesses
+    MAX_PARALLEL_CALLS = 16
+    
+    # Shared by every call so nested fan-outs (batch inside batch_get) still
+    # respect MAX_PARALLEL_CALLS
+    _call_slots = threading.BoundedSemaphore(MAX_PARALLEL_CALLS)
+    
+    # Nodes registered via use_direct_rpc skip the CLI and talk JSON-RPC to
+    # bitcoind over keep-alive connections, pooled per node across threads
+    _http_endpoints: Dict[str, Tuple[str, int]] = {}
+    _http_auth = ""
+    _http_pool: Dict[str, List[http.client.HTTPConnection]] = defaultdict(list)
+    _http_lock = threading.Lock()
+    
+    @staticmethod
+    def use_direct_rpc(node_ips: Dict[str, str], user: str, password: str, port: int = 18443):
+        """Route RPCs for these nodes straight to bitcoind at ip:port instead of `warnet bitcoin rpc`"""
+        WarnetRPC._http_auth = "Basic " + base64.b64encode(f"{user}:{password}".encode()).decode()
+        WarnetRPC._http_endpoints = {node: (ip, port) for node, ip in node_ips.items() if ip}
+        logger.info("Direct RPC enabled for %s nodes on port %s", len(WarnetRPC._http_endpoints), port)
+    
+    @staticmethod
+    def _http_post(node: str, endpoint: Tuple[str, int], payload) -> Any:
+        """POST one JSON-RPC request (or batch) to a node, reusing a pooled connection"""
+        with WarnetRPC._http_lock:
+            pool = WarnetRPC._http_pool[node]
+            conn = pool.pop() if pool else None
+        if conn is None:
+            conn = http.client.HTTPConnection(*endpoint, timeout=10)
+        try:
+            conn.request("POST", "/", json.dumps(payload),
+                         {"Authorization": WarnetRPC._http_auth, "Content-Type": "application/json"})
+            response = conn.getresponse()
+            body = response.read()
+            # bitcoind answers RPC errors with a JSON body and HTTP 500; anything else is transport
+            if response.status not in (200, 500):
+                raise http.client.HTTPException(f"HTTP {response.status} {response.reason}")
+            decoded = _json_loads(body)
+        except Exception:
+            conn.close()
+            raise
+        with WarnetRPC._http_lock:
+            WarnetRPC._http_pool[node].append(conn)
+        return decoded
+    
+    @staticmethod
+    def _rpc_param(arg):
+        """Type a CLI-style string argument the way bitcoin-cli would ("10" -> 10)"""
+        if not isinstance(arg, str):
+            return arg
+        try:
+            return json.loads(arg)
+        except ValueError:
+            return arg
+    
+    @staticmethod
+    def _call_http(node: str, calls: List[Tuple[str, ...]], retries: int = 3) -> List[Any]:
+        """Run calls as a single JSON-RPC request, falling back to the CLI if bitcoind is unreachable"""
+        payload = [{"jsonrpc": "1.0", "id": i, "method": rpc[0],
+                    "params": [WarnetRPC._rpc_param(a) for a in rpc[1:]]}
+                    for i, rpc in enumerate(calls)]
+        for attempt in range(retries):
+            with WarnetRPC._http_lock:
+                endpoint = WarnetRPC._http_endpoints.get(node)
+            if endpoint is None:
+                # Another thread gave up on this node while this call was queued
+                return [WarnetRPC._call_cli(node, *rpc) for rpc in calls]
+            try:
+                if len(payload) == 1:
+                    responses = [WarnetRPC._http_post(node, endpoint, payload[0])]
+                else:
+                    responses = sorted(WarnetRPC._http_post(node, endpoint, payload), key=lambda r: r.get("id"))
+                break
+            except (OSError, ValueError, http.client.HTTPException) as e:
+                logger.warning("Direct RPC to %s failed (%s), retrying...", node, e)
+        else:
+            # Stop paying connect timeouts on every call to an unreachable node
+            logger.warning("Direct RPC to %s unavailable, falling back to warnet CLI", node)
+            with WarnetRPC._http_lock:
+                WarnetRPC._http_endpoints.pop(node, None)
+            return [WarnetRPC._call_cli(node, *rpc) for rpc in calls]
+        
+        results = []
+        for rpc, response in zip(calls, responses):
+            if response.get("error"):
+                logger.error("RPC error for %s.%s: %s", node, rpc[0], response['error'])
+                results.append({})
+            else:
+                # The CLI prints nothing for a null result, which call() reports as {}
+                result = response.get("result")
+                results.append({} if result is None else result)
+        return results
+
+    @staticmethod
+    def batch_get(nodes: List[str], method: Callable[[str], Any]) -> Dict[str, Any]:
+        """Call a per-node RPC helper (e.g. WarnetRPC.get_block_count) on all nodes concurrently"""
+        nodes = list(nodes)
+        if len(nodes) <= 1:
+            return {node: method(node) for node in nodes}
+        workers = min(len(nodes), WarnetRPC.MAX_PARALLEL_CALLS)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(nodes, executor.map(method, nodes)))
+    
+    @staticmethod
+    def batch(node: str, calls: List[Tuple[str, ...]]) -> List[Any]:
+        """
+        Run several RPCs against one node, e.g. [("getblockcount",), ("getblockhash", "10")].
+        Results are returned in call order, as WarnetRPC.call would return them.
+        Direct RPC nodes get one JSON-RPC batch request; `warnet bitcoin rpc`
+        takes a single command, so otherwise the calls are issued concurrently.
+        """
+        if node in WarnetRPC._http_endpoints:
+            return WarnetRPC._call_http(node, calls)
+        if len(calls) <= 1:
+            return [WarnetRPC.call(node, *rpc) for rpc in calls]
+        workers = min(len(calls), WarnetRPC.MAX_PARALLEL_CALLS)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda rpc: WarnetRPC.call(node, *rpc), calls))
     
     @staticmethod
     def call(node: str, command: str, *args, retries: int = 3) -> dict:
         """Execute a Bitcoin RPC command via Warnet with retry"""
+        if node in WarnetRPC._http_endpoints:
+            return WarnetRPC._call_http(node, [(command,) + args], retries)[0]
+        return WarnetRPC._call_cli(node, command, *args, retries=retries)
+    
+    @staticmethod
+    def _call_cli(node: str, command: str, *args, retries: int = 3) -> dict:
+        """Execute a Bitcoin RPC command through the `warnet` CLI"""
         for attempt in range(retries):
             try:
                 cmd = ["warnet", "bitcoin", "rpc", node, command] + list(args)
-                result = subprocess.run(cmd, capture_output=True, text=True, check=True, timeout=10)
+                with WarnetRPC._call_slots:
+                    result = subprocess.run(cmd, capture_output=True, check=True, timeout=10)
                 
-                if not result.stdout or not result.stdout.strip():
+                stdout = result.stdout
+                if not stdout or stdout.isspace():
                     return {}
                 
-                # Try to parse as JSON
+                # Try to parse as JSON straight from the captured bytes; the parsers
+                # skip surrounding whitespace, so large responses aren't copied by strip()
                 try:
-                    return json.loads(result.stdout.strip())
-                except json.JSONDecodeError as e:
+                    return _json_loads(stdout)
+                except ValueError:
                     # If it's a simple value (like a number), try to handle it
-                    output = result.stdout.strip()
+                    output = stdout.decode().strip()
                     
                     # Check if it's a number
                     if output.isdigit():
                         return int(output)
                     
+                    # If it looks like a hash (hex string), return as is. Checked
+                    # before float() so a hash like "12e4..." can't parse as a number
+                    if _HEX64_RE.match(output):
+                        return output
+                    
                     # Check if it's a float
                     try:
                         return float(output)
@@ -94,27 +289,26 @@ class WarnetRPC:
                     if output.lower() in ('true', 'false'):
                         return output.lower() == 'true'
                     
-                    # If it looks like a hash (hex string), return as is
-                    if all(c in '0123456789abcdef' for c in output.lower()) and len(output) == 64:
-                        return output
-                    
                     # Otherwise log the error and return the raw output
-                    logger.debug(f"Non-JSON response from {node}.{command}: {output[:100]}")
+                    logger.debug("Non-JSON response from %s.%s: %s", node, command, output[:100])
                     return output
                     
             except subprocess.CalledProcessError as e:
                 if attempt == retries - 1:
-                    logger.error(f"RPC error for {node}.{command}: {e.stderr}")
+                    logger.error("RPC error for %s.%s: %s", node, command, e.stderr.decode(errors='replace'))
                     return {}
                 time.sleep(1)
             except subprocess.TimeoutExpired:
-                logger.warning(f"RPC timeout for {node}.{command}, retrying...")
+                logger.warning("RPC timeout for %s.%s, retrying...", node, command)
                 continue
         return {}
     
     @staticmethod
     def get_block_count(node: str) -> int:
-        result = WarnetRPC.call(node, "getblockcount")
+        return WarnetRPC._as_block_count(WarnetRPC.call(node, "getblockcount"))
+    
+    @staticmethod
+    def _as_block_count(result) -> int:
         if isinstance(result, int):
             return result
         elif isinstance(result, str) and result.isdigit():
@@ -125,7 +319,10 @@ class WarnetRPC:
     
     @staticmethod
     def get_best_block_hash(node: str) -> str:
-        result = WarnetRPC.call(node, "getbestblockhash")
+        return WarnetRPC._as_block_hash(WarnetRPC.call(node, "getbestblockhash"))
+    
+    @staticmethod
+    def _as_block_hash(result) -> str:
         if isinstance(result, str):
             return result
         return ""
@@ -152,6 +349,10 @@ class WarnetRPC:
         result = WarnetRPC.call(node, "getpeerinfo")
         return result if isinstance(result, list) else []
     
+    # RPCs behind a NetworkState snapshot entry, issued as one batch per node;
+    # getblockchaininfo already carries the height and best hash
+    SNAPSHOT_CALLS = [("getblockchaininfo",), ("getmempoolinfo",), ("getpeerinfo",)]
+    
     @staticmethod
     def get_network_info(node: str) -> dict:
         return WarnetRPC.call(node, "getnetworkinfo")
@@ -165,6 +366,17 @@ class WarnetRPC:
     def set_ban(node: str, ip: str, action: str, duration: int = 86400):
         return WarnetRPC.call(node, "setban", ip, action, str(duration))
     
+    @staticmethod
+    def set_ban_many(node: str, ips: List[str], action: str, duration: int = 86400) -> list:
+        """Apply the same setban action for several IPs on one node as a single batch"""
+        return WarnetRPC.batch(node, [("setban", ip, action, str(duration)) for ip in ips])
+    
+    @staticmethod
+    def set_bans(bans: Dict[str, List[str]], action: str, duration: int = 86400):
+        """set_ban_many on several nodes concurrently, e.g. {node: [ips to ban]}"""
+        bans = {node: ips for node, ips in bans.items() if ips}
+        WarnetRPC.batch_get(bans, lambda node: WarnetRPC.set_ban_many(node, bans[node], action, duration))
+    
     @staticmethod
     def clear_banned(node: str):
         return WarnetRPC.call(node, "clearbanned")
@@ -177,26 +389,55 @@ class WarnetRPC:
 class NetworkState:
     """Manages the state of the Warnet network"""
     
-    def __init__(self, nodes: List[str]):
+    _block_hash_shelf = None  # shelve.Shelf once opened, False when persistence is off
+    _block_hash_shelf_lock = threading.Lock()
+    # Verified "tip:height" -> block hash; also guarded by _block_hash_shelf_lock
+    _block_hash_memo: Dict[str, str] = {}
+    MAX_BLOCK_HASH_MEMO = 100_000
+    
+    def __init__(self, nodes: List[str], node_info: Optional[Dict[str, NodeInfo]] = None):
         self.nodes = nodes
         self.node_info: Dict[str, NodeInfo] = {}
-        self.discover_nodes()
+        self.ip_by_node: Dict[str, str] = {}
+        self.node_by_ip: Dict[str, str] = {}
+        if node_info is None:
+            self.discover_nodes()
+        else:
+            # Caller already knows the nodes (e.g. from a recent discovery)
+            self.node_info.update(node_info)
+            self._index_nodes()
+    
+    def _index_nodes(self):
+        """Index known node IPs both ways; nodes without an IP can't be banned and are left out"""
+        self.ip_by_node = {node: info.ip for node, info in self.node_info.items() if info.ip}
+        self.node_by_ip = {ip: node for node, ip in self.ip_by_node.items()}
+    
+    @staticmethod
+    def _discover_node(node: str):
+        """getnetworkinfo for one node, returning any error for discover_nodes to log"""
+        try:
+            return WarnetRPC.get_network_info(node)
+        except Exception as e:
+            return e
     
     def discover_nodes(self):
         """Discover node IPs and versions"""
         logger.info("Discovering node information...")
-        for node in self.nodes:
+        network_infos = WarnetRPC.batch_get(self.nodes, self._discover_node)
+        for node, network_info in network_infos.items():
             try:
-                network_info = WarnetRPC.get_network_info(node)
+                if isinstance(network_info, Exception):
+                    raise network_info
                 if network_info:
                     ip = self._extract_ip(network_info)
                     version = network_info.get('subversion', 'unknown')
                     self.node_info[node] = NodeInfo(node, ip, version)
-                    logger.info(f"{node}: {ip} ({version})")
+                    logger.info("%s: %s (%s)", node, ip, version)
                 else:
-                    logger.warning(f"Could not get network info for {node}")
+                    logger.warning("Could not get network info for %s", node)
             except Exception as e:
-                logger.error(f"Error discovering {node}: {e}", exc_info=True)
+                logger.error("Error discovering %s: %s", node, e, exc_info=True)
+        self._index_nodes()
     
     def _extract_ip(self, network_info: dict) -> str:
         """Extract IP address from network info"""
@@ -211,67 +452,133 @@ class NetworkState:
         """Take a complete snapshot of network state"""
         snapshot = NetworkSnapshot(
             timestamp=datetime.now().isoformat(),
-            nodes={}
+            nodes=WarnetRPC.batch_get(self.nodes, self._snapshot_node)
         )
         
-        for node in self.nodes:
-            blockchain_info = WarnetRPC.get_blockchain_info(node)
-            snapshot.nodes[node] = {
-                'height': WarnetRPC.get_block_count(node),
-                'best_hash': WarnetRPC.get_best_block_hash(node),
-                'mempool': WarnetRPC.get_mempool_info(node),
-                'peer_count': len(WarnetRPC.get_peer_info(node)),
-                'chain_work': blockchain_info.get('chainwork', ''),
-                'difficulty': blockchain_info.get('difficulty', 0)
-            }
-        
-        # Detect fork
-        unique_hashes = set(data['best_hash'] for data in snapshot.nodes.values())
+        # Detect fork (one pass over the joined per-node results)
+        unique_hashes = {data['best_hash'] for data in snapshot.nodes.values()}
         snapshot.fork_detected = len(unique_hashes) > 1
         snapshot.unique_tips = len(unique_hashes)
         
         return snapshot
     
+    @staticmethod
+    def _snapshot_node(node: str) -> dict:
+        """Collect the snapshot entry for a single node"""
+        blockchain_info, mempool, peers = WarnetRPC.batch(node, WarnetRPC.SNAPSHOT_CALLS)
+        return {
+            'height': WarnetRPC._as_block_count(blockchain_info.get('blocks', 0)),
+            'best_hash': WarnetRPC._as_block_hash(blockchain_info.get('bestblockhash', '')),
+            'mempool': mempool,
+            'peer_count': len(peers) if isinstance(peers, list) else 0,
+            'chain_work': blockchain_info.get('chainwork', ''),
+            'difficulty': blockchain_info.get('difficulty', 0)
+        }
+    
+    @staticmethod
+    def _chain_tip(node: str) -> Tuple[int, str]:
+        """Get a single node's chain tip (height, hash)"""
+        return WarnetRPC.get_block_count(node), WarnetRPC.get_best_block_hash(node)
+    
     def get_chain_tips(self) -> Dict[str, Tuple[int, str]]:
         """Get chain tips for all nodes (height, hash)"""
-        tips = {}
-        for node in self.nodes:
-            height = WarnetRPC.get_block_count(node)
-            hash = WarnetRPC.get_best_block_hash(node)
-            tips[node] = (height, hash)
-        return tips
-    
-    def detect_fork(self) -> bool:
+        return WarnetRPC.batch_get(self.nodes, self._chain_tip)
+    
+    def _tips(self, snapshot: Optional[NetworkSnapshot] = None) -> Dict[str, Tuple[int, str]]:
+        """Chain tips from a snapshot already in hand, or fresh from the nodes"""
+        if snapshot is None:
+            return self.get_chain_tips()
+        return {node: (data['height'], data['best_hash']) for node, data in snapshot.nodes.items()}
+    
+    def detect_fork(self, snapshot: Optional[NetworkSnapshot] = None) -> bool:
         """Check if network is forked"""
-        tips = self.get_chain_tips()
+        tips = self._tips(snapshot)
         hashes = set(hash for _, hash in tips.values())
         return len(hashes) > 1
     
-    def find_fork_point(self) -> Optional[int]:
+    @staticmethod
+    def _cached_block_hash_at(node: str, height: int, tip_hash: str) -> str:
+        """
+        Block hash at `height` on a node whose chain ends at `tip_hash`.
+        getblockhash answers from the node's current chain, so an answer is only
+        cached once the node still reports `tip_hash` as its best block after
+        answering; a node that has moved off the tip gets an uncached lookup.
+        """
+        key = f"{tip_hash}:{height}"
+        # The answer depends only on (tip, height), so cached entries are shared by all nodes
+        shelf = NetworkState._persistent_block_hashes()
+        with NetworkState._block_hash_shelf_lock:
+            block_hash = NetworkState._block_hash_memo.get(key)
+            if block_hash is None and shelf is not False:
+                block_hash = shelf.get(key)
+        if block_hash:
+            return block_hash
+        
+        block_hash = WarnetRPC.call(node, "getblockhash", str(height))
+        if not isinstance(block_hash, str):
+            raise LookupError(f"No block hash at height {height} from {node}")
+        if WarnetRPC.get_best_block_hash(node) == tip_hash:
+            with NetworkState._block_hash_shelf_lock:
+                if len(NetworkState._block_hash_memo) >= NetworkState.MAX_BLOCK_HASH_MEMO:
+                    NetworkState._block_hash_memo.clear()
+                NetworkState._block_hash_memo[key] = block_hash
+                if shelf is not False:
+                    shelf[key] = block_hash
+        return block_hash
+    
+    @staticmethod
+    def _persistent_block_hashes():
+        """Open the on-disk block hash cache on first use if WARNET_PERSIST_CACHE=1, else False"""
+        with NetworkState._block_hash_shelf_lock:
+            if NetworkState._block_hash_shelf is None:
+                if os.environ.get("WARNET_PERSIST_CACHE") != "1":
+                    NetworkState._block_hash_shelf = False
+                else:
+                    try:
+                        shelf = shelve.open(str(BLOCK_HASH_CACHE_FILE))
+                        atexit.register(shelf.close)
+                        NetworkState._block_hash_shelf = shelf
+                    except Exception as e:
+                        logger.warning("Block hash cache %s unavailable: %s", BLOCK_HASH_CACHE_FILE, e)
+                        NetworkState._block_hash_shelf = False
+            return NetworkState._block_hash_shelf
+    
+    def find_fork_point(self, snapshot: Optional[NetworkSnapshot] = None) -> Optional[int]:
         """Find the block height where chains diverged"""
-        tips = self.get_chain_tips()
+        tips = self._tips(snapshot)
         if len(set(hash for _, hash in tips.values())) <= 1:
             return None
         
         # Get minimum height
         min_height = min(height for height, _ in tips.values())
         
+        # Nodes on the same tip share a chain, so one of them answers for all;
+        # nodes whose tip is unknown are asked individually
+        query_nodes = []
+        seen_tips = set()
+        for node, (_, tip_hash) in tips.items():
+            if not tip_hash or tip_hash not in seen_tips:
+                seen_tips.add(tip_hash)
+                query_nodes.append(node)
+        
+        def block_hash_at(node: str, height: int) -> Optional[str]:
+            tip_hash = tips[node][1]
+            try:
+                if tip_hash:
+                    return self._cached_block_hash_at(node, height, tip_hash)
+                return WarnetRPC.call(node, "getblockhash", str(height))
+            except Exception:
+                return None
+        
         # Binary search for fork point
         left, right = 0, min_height
         fork_height = 0
         
         while left <= right:
             mid = (left + right) // 2
-            # Check if all nodes agree on block at this height
-            hashes_at_height = set()
-            
-            for node in self.nodes:
-                try:
-                    block_hash = WarnetRPC.call(node, "getblockhash", str(mid))
-                    if isinstance(block_hash, str):
-                        hashes_at_height.add(block_hash)
-                except:
-                    pass
+            # Check if all nodes agree on block at this height, asking them concurrently
+            results = WarnetRPC.batch_get(query_nodes, lambda node: block_hash_at(node, mid))
+            hashes_at_height = {h for h in results.values() if isinstance(h, str)}
             
             if len(hashes_at_height) == 1:
                 fork_height = mid
@@ -291,7 +598,7 @@ class NetworkPartition:
     
     def partition_by_version(self, version_a: str, version_b: str):
         """Partition network by Bitcoin Core version"""
-        logger.info(f"Partitioning network: {version_a} vs {version_b}")
+        logger.info("Partitioning network: %s vs %s", version_a, version_b)
         
         group_a = [n for n, info in self.state.node_info.items() 
                    if version_a in info.version]
@@ -303,33 +610,31 @@ class NetworkPartition:
     
     def partition_custom(self, group_a: List[str], group_b: List[str]):
         """Partition network into custom groups"""
-        logger.info(f"Custom partition: {group_a} vs {group_b}")
+        logger.info("Custom partition: %s vs %s", group_a, group_b)
         self._partition_groups(group_a, group_b)
         self.active_partitions.append(('custom', group_a, group_b))
     
     def _partition_groups(self, group_a: List[str], group_b: List[str]):
         """Ban connections between two groups"""
-        for node_a in group_a:
-            for node_b in group_b:
-                if node_b in self.state.node_info:
-                    ip_b = self.state.node_info[node_b].ip
-                    WarnetRPC.set_ban(node_a, ip_b, "add")
+        ip_by_node = self.state.ip_by_node
+        ips_a = [ip_by_node[n] for n in group_a if n in ip_by_node]
+        ips_b = [ip_by_node[n] for n in group_b if n in ip_by_node]
         
+        bans = defaultdict(list)
+        for node_a in group_a:
+            bans[node_a].extend(ips_b)
         for node_b in group_b:
-            for node_a in group_a:
-                if node_a in self.state.node_info:
-                    ip_a = self.state.node_info[node_a].ip
-                    WarnetRPC.set_ban(node_b, ip_a, "add")
+            bans[node_b].extend(ips_a)
+        WarnetRPC.set_bans(bans, "add")
         
         logger.info("Partition complete")
     
     def reconnect_all(self):
         """Remove all bans and reconnect network"""
         logger.info("Reconnecting network...")
-        for node in self.state.nodes:
-            WarnetRPC.clear_banned(node)
+        WarnetRPC.batch_get(self.state.nodes, WarnetRPC.clear_banned)
         
-        # Force some connections
+        # Force some connections (after every clearbanned has returned)
         if len(self.state.nodes) >= 2:
             node_0 = self.state.nodes[0]
             node_1 = self.state.nodes[1]
@@ -338,33 +643,85 @@ class NetworkPartition:
                 WarnetRPC.add_node(node_0, ip_1)
         
         self.active_partitions.clear()
+        # Cached hashes are keyed by tip and stay valid, but once partitions
+        # heal the tips move on and old entries are just memory
+        with NetworkState._block_hash_shelf_lock:
+            NetworkState._block_hash_memo.clear()
         logger.info("Reconnection initiated")
 
 
 class TimeSeriesCollector:
     """Collects time-series data during tests"""
     
-    def __init__(self, state: NetworkState):
+    def __init__(self, state: NetworkState, record_series: bool = True):
         self.state = state
-        self.height_data = defaultdict(list)  # {node: [(timestamp, height)]}
-        self.mempool_data = defaultdict(list)  # {node: [(timestamp, size, bytes)]}
+        self.record_series = record_series
+        # Running per-node aggregates, which is all the summary and Analyzer read
+        self.height_totals: Dict[str, dict] = {}  # {node: {n, start, end}}
+        self.mempool_totals: Dict[str, dict] = {}  # {node: {n, sum_size, min/max_size, max_bytes, last_size/bytes}}
+        # Full series as parallel typed arrays per node; record_series=False skips them
+        # for callers that only need the aggregates
+        self.height_series = defaultdict(lambda: {'t': array('d'), 'h': array('q')})
+        self.mempool_series = defaultdict(lambda: {'t': array('d'), 'size': array('q'), 'bytes': array('q')})
         self.fork_events = []  # [(timestamp, fork_detected, unique_tips)]
     
+    @property
+    def height_data(self) -> Dict[str, List[Tuple[float, int]]]:
+        """{node: [(timestamp, height)]}, built from height_series"""
+        return defaultdict(list, {node: list(zip(data['t'], data['h']))
+                                  for node, data in self.height_series.items()})
+    
+    @property
+    def mempool_data(self) -> Dict[str, List[Tuple[float, int, int]]]:
+        """{node: [(timestamp, size, bytes)]}, built from mempool_series"""
+        return defaultdict(list, {node: list(zip(data['t'], data['size'], data['bytes']))
+                                  for node, data in self.mempool_series.items()})
+    
     def collect_heights(self):
         """Collect current block heights"""
         timestamp = time.time()
-        for node in self.state.nodes:
-            height = WarnetRPC.get_block_count(node)
-            self.height_data[node].append((timestamp, height))
+        heights = WarnetRPC.batch_get(self.state.nodes, WarnetRPC.get_block_count)
+        for node, height in heights.items():
+            totals = self.height_totals.get(node)
+            if totals is None:
+                self.height_totals[node] = {'n': 1, 'start': height, 'end': height}
+            else:
+                totals['n'] += 1
+                totals['end'] = height
+            
+            if self.record_series:
+                data = self.height_series[node]
+                data['t'].append(timestamp)
+                data['h'].append(height)
     
     def collect_mempools(self):
         """Collect mempool data"""
         timestamp = time.time()
-        for node in self.state.nodes:
-            mempool = WarnetRPC.get_mempool_info(node)
+        mempools = WarnetRPC.batch_get(self.state.nodes, WarnetRPC.get_mempool_info)
+        for node, mempool in mempools.items():
             size = mempool.get('size', 0)
             bytes = mempool.get('bytes', 0)
-            self.mempool_data[node].append((timestamp, size, bytes))
+            totals = self.mempool_totals.get(node)
+            if totals is None:
+                self.mempool_totals[node] = {'n': 1, 'sum_size': size, 'min_size': size, 'max_size': size,
+                                             'max_bytes': bytes, 'last_size': size, 'last_bytes': bytes}
+            else:
+                totals['n'] += 1
+                totals['sum_size'] += size
+                if size < totals['min_size']:
+                    totals['min_size'] = size
+                if size > totals['max_size']:
+                    totals['max_size'] = size
+                if bytes > totals['max_bytes']:
+                    totals['max_bytes'] = bytes
+                totals['last_size'] = size
+                totals['last_bytes'] = bytes
+            
+            if self.record_series:
+                data = self.mempool_series[node]
+                data['t'].append(timestamp)
+                data['size'].append(size)
+                data['bytes'].append(bytes)
     
     def collect_fork_status(self):
         """Collect fork detection status"""
@@ -381,24 +738,20 @@ class TimeSeriesCollector:
         }
         
         # Height stats
-        for node, data in self.height_data.items():
-            if data:
-                heights = [h for _, h in data]
-                stats['height_progression'][node] = {
-                    'start': heights[0],
-                    'end': heights[-1],
-                    'blocks_produced': heights[-1] - heights[0]
-                }
+        for node, totals in self.height_totals.items():
+            stats['height_progression'][node] = {
+                'start': totals['start'],
+                'end': totals['end'],
+                'blocks_produced': totals['end'] - totals['start']
+            }
         
         # Mempool stats
-        for node, data in self.mempool_data.items():
-            if data:
-                sizes = [s for _, s, _ in data]
-                stats['mempool_stats'][node] = {
-                    'avg_size': statistics.mean(sizes) if sizes else 0,
-                    'max_size': max(sizes) if sizes else 0,
-                    'min_size': min(sizes) if sizes else 0
-                }
+        for node, totals in self.mempool_totals.items():
+            stats['mempool_stats'][node] = {
+                'avg_size': _mean(totals['sum_size'], totals['n']),
+                'max_size': totals['max_size'],
+                'min_size': totals['min_size']
+            }
         
         # Fork duration
         fork_periods = []
@@ -441,20 +794,27 @@ class Monitor:
     
     def monitor_session(self, duration: int, height_interval: int = 5, mempool_interval: int = 30):
         """Monitor for a specific duration"""
-        logger.info(f"Monitoring session for {duration}s")
+        logger.info("Monitoring session for %ss", duration)
         start_time = time.time()
-        last_height_check = 0
-        last_mempool_check = 0
+        end_time = start_time + duration
+        
+        # Sleep straight to whichever collector is due next; intervals keep the
+        # old loop's 1s floor so a zero interval can't spin
+        intervals = {'height': max(height_interval, 1), 'mempool': max(mempool_interval, 1)}
+        deadlines = [(start_time + interval, kind) for kind, interval in intervals.items()]
+        heapq.heapify(deadlines)
         
-        while time.time() - start_time < duration:
+        while True:
+            due, kind = heapq.heappop(deadlines)
+            if due >= end_time:
+                break
+            time.sleep(max(0, due - time.time()))
             current_time = time.time() - start_time
             
-            # Collect heights
-            if current_time - last_height_check >= height_interval:
+            if kind == 'height':
                 try:
                     self.collector.collect_heights()
                     self.collector.collect_fork_status()
-                    last_height_check = current_time
                     
                     # Display current state
                     tips = self.state.get_chain_tips()
@@ -462,17 +822,16 @@ class Monitor:
                     for node, (height, hash) in tips.items():
                         print(f"  {node}: {height} ({hash[:12]}...)")
                 except Exception as e:
-                    logger.error(f"Error collecting heights: {e}")
-            
-            # Collect mempools
-            if current_time - last_mempool_check >= mempool_interval:
+                    logger.error("Error collecting heights: %s", e)
+            else:
                 try:
                     self.collector.collect_mempools()
-                    last_mempool_check = current_time
                 except Exception as e:
-                    logger.error(f"Error collecting mempools: {e}")
+                    logger.error("Error collecting mempools: %s", e)
             
-            time.sleep(1)
+            # Keep the cadence, but if collection overran the interval run
+            # once now rather than firing a burst of missed ticks
+            heapq.heappush(deadlines, (max(due + intervals[kind], time.time()), kind))
         
         logger.info("Monitoring session complete")
 
@@ -523,15 +882,13 @@ class Analyzer:
         """Analyze how mempools diverged during test"""
         analysis = {}
         
-        for node, data in collector.mempool_data.items():
-            if data:
-                timestamps, sizes, bytes_data = zip(*data)
-                analysis[node] = {
-                    'peak_size': max(sizes),
-                    'peak_bytes': max(bytes_data),
-                    'final_size': sizes[-1],
-                    'final_bytes': bytes_data[-1]
-                }
+        for node, totals in collector.mempool_totals.items():
+            analysis[node] = {
+                'peak_size': totals['max_size'],
+                'peak_bytes': totals['max_bytes'],
+                'final_size': totals['last_size'],
+                'final_bytes': totals['last_bytes']
+            }
         
         return analysis
 
@@ -564,16 +921,14 @@ class TestScenario(ABC):
     
     def run(self) -> TestResult:
         """Run the complete test scenario"""
-        logger.info(f"{'='*60}")
-        logger.info(f"Starting test: {self.name}")
-        logger.info(f"{'='*60}")
+        logger.info("%s\nStarting test: %s\n%s", _BAR60, self.name, _BAR60)
         
         start_time = datetime.now()
         
         try:
             # Pre-test snapshot
             pre_snapshot = self.state.snapshot()
-            logger.info(f"Pre-test snapshot: Fork={pre_snapshot.fork_detected}")
+            logger.info("Pre-test snapshot: Fork=%s", pre_snapshot.fork_detected)
             
             # Setup
             self.setup()
@@ -584,10 +939,10 @@ class TestScenario(ABC):
             
             # Post-test snapshot
             post_snapshot = self.state.snapshot()
-            logger.info(f"Post-test snapshot: Fork={post_snapshot.fork_detected}")
+            logger.info("Post-test snapshot: Fork=%s", post_snapshot.fork_detected)
             
             # Analyze
-            metrics = self.analyze()
+            metrics = self.analyze(pre_snapshot, post_snapshot)
             
             end_time = datetime.now()
             duration = (end_time - start_time).total_seconds()
@@ -604,7 +959,7 @@ class TestScenario(ABC):
             )
             
         except Exception as e:
-            logger.error(f"Test {self.name} failed: {e}", exc_info=True)
+            logger.error("Test %s failed: %s", self.name, e, exc_info=True)
             end_time = datetime.now()
             duration = (end_time - start_time).total_seconds()
             
@@ -625,20 +980,23 @@ class TestScenario(ABC):
             try:
                 self.teardown()
             except Exception as e:
-                logger.error(f"Teardown failed: {e}")
+                logger.error("Teardown failed: %s", e)
         
-        logger.info(f"Test {self.name} complete")
+        logger.info("Test %s complete", self.name)
         return self.result
     
-    def analyze(self) -> dict:
-        """Analyze test results"""
+    def analyze(self, pre_snapshot: NetworkSnapshot, post_snapshot: NetworkSnapshot) -> dict:
+        """Analyze test results from the snapshots run() already took"""
+        reorg = Analyzer.calculate_reorg_depth(pre_snapshot, post_snapshot)
+        stats = self.monitor.collector.get_summary_stats()
         metrics = {
-            'fork_point': self.state.find_fork_point(),
-            'reorg_analysis': Analyzer.calculate_reorg_depth(
-                self.result.pre_snapshot if self.result else NetworkSnapshot(timestamp=""),
-                self.state.snapshot()
-            ),
-            'summary_stats': self.monitor.collector.get_summary_stats(),
+            # No fork in the post-test snapshot means there is no fork point to search for
+            'fork_point': self.state.find_fork_point(post_snapshot) if post_snapshot.fork_detected else None,
+            'reorg_analysis': reorg,
+            'reorgs_occurred_count': sum(1 for data in reorg.values() if data.get('occurred')),
+            'summary_stats': stats,
+            'total_blocks_produced': sum(data['blocks_produced']
+                                         for data in stats['height_progression'].values()),
             'mempool_analysis': Analyzer.analyze_mempool_divergence(self.monitor.collector)
         }
         return metrics
@@ -656,7 +1014,7 @@ class VersionPartitionTest(TestScenario):
     def execute(self):
         duration = self.config.get('duration', 180)
         monitor_interval = self.config.get('monitor_interval', 5)
-        logger.info(f"Executing test - monitoring for {duration}s")
+        logger.info("Executing test - monitoring for %ss", duration)
         self.monitor.monitor_session(duration, height_interval=monitor_interval)
     
     def teardown(self):
@@ -670,14 +1028,14 @@ class AsymmetricSplitTest(TestScenario):
     
     def setup(self):
         majority_size = self.config.get('majority_size', 6)
-        logger.info(f"Setting up asymmetric split ({majority_size} vs others)")
+        logger.info("Setting up asymmetric split (%s vs others)", majority_size)
         majority = self.state.nodes[:majority_size]
         minority = self.state.nodes[majority_size:]
         self.partition.partition_custom(majority, minority)
     
     def execute(self):
         duration = self.config.get('duration', 180)
-        logger.info(f"Executing asymmetric split test - {duration}s")
+        logger.info("Executing asymmetric split test - %ss", duration)
         self.monitor.monitor_session(duration)
     
     def teardown(self):
@@ -697,19 +1055,19 @@ class FlappingConnectionTest(TestScenario):
         disconnect_duration = self.config.get('disconnect_duration', 30)
         connect_duration = self.config.get('connect_duration', 30)
         
-        logger.info(f"Flapping connections for {iterations} iterations")
+        logger.info("Flapping connections for %s iterations", iterations)
         node_a = self.state.nodes[0]
         node_b = self.state.nodes[4]
         ip_b = self.state.node_info[node_b].ip
         
         for i in range(iterations):
-            logger.info(f"Iteration {i+1}: Disconnecting")
+            logger.info("Iteration %s: Disconnecting", i+1)
             WarnetRPC.set_ban(node_a, ip_b, "add", disconnect_duration)
             self.monitor.collector.collect_heights()
             self.monitor.collector.collect_fork_status()
             time.sleep(disconnect_duration)
             
-            logger.info(f"Iteration {i+1}: Reconnecting")
+            logger.info("Iteration %s: Reconnecting", i+1)
             WarnetRPC.set_ban(node_a, ip_b, "remove")
             self.monitor.collector.collect_heights()
             self.monitor.collector.collect_fork_status()
@@ -733,13 +1091,11 @@ class RollingIsolationTest(TestScenario):
         logger.info("Starting rolling isolation")
         
         for node in self.state.nodes:
-            logger.info(f"Isolating {node}")
+            logger.info("Isolating %s", node)
             
             # Ban this node from all others
-            for other_node in self.state.nodes:
-                if other_node != node and other_node in self.state.node_info:
-                    other_ip = self.state.node_info[other_node].ip
-                    WarnetRPC.set_ban(node, other_ip, "add", isolation_duration)
+            other_ips = [ip for other, ip in self.state.ip_by_node.items() if other != node]
+            WarnetRPC.set_ban_many(node, other_ips, "add", isolation_duration)
             
             self.monitor.collector.collect_heights()
             self.monitor.collector.collect_fork_status()
@@ -747,7 +1103,7 @@ class RollingIsolationTest(TestScenario):
             
             # Restore
             WarnetRPC.clear_banned(node)
-            logger.info(f"Reconnected {node}")
+            logger.info("Reconnected %s", node)
             time.sleep(stabilization)
     
     def teardown(self):
@@ -760,22 +1116,19 @@ class StarTopologyTest(TestScenario):
     
     def setup(self):
         hub = self.config.get('hub_node', self.state.nodes[0])
-        logger.info(f"Creating star topology with {hub} as hub")
+        logger.info("Creating star topology with %s as hub", hub)
         
         spokes = [n for n in self.state.nodes if n != hub]
         
         # Ban all spoke-to-spoke connections
-        for i, spoke_a in enumerate(spokes):
-            for spoke_b in spokes[i+1:]:
-                if spoke_a in self.state.node_info and spoke_b in self.state.node_info:
-                    ip_a = self.state.node_info[spoke_a].ip
-                    ip_b = self.state.node_info[spoke_b].ip
-                    WarnetRPC.set_ban(spoke_a, ip_b, "add")
-                    WarnetRPC.set_ban(spoke_b, ip_a, "add")
+        ip_by_node = self.state.ip_by_node
+        known_spokes = [spoke for spoke in spokes if spoke in ip_by_node]
+        WarnetRPC.set_bans({spoke: [ip_by_node[other] for other in known_spokes if other != spoke]
+                            for spoke in known_spokes}, "add")
     
     def execute(self):
         duration = self.config.get('duration', 180)
-        logger.info(f"Monitoring star topology - {duration}s")
+        logger.info("Monitoring star topology - %ss", duration)
         self.monitor.monitor_session(duration)
     
     def teardown(self):
@@ -800,13 +1153,11 @@ class CascadeFailureTest(TestScenario):
         
         for i in range(num_failures):
             node = self.state.nodes[i]
-            logger.info(f"Failing node {node}")
+            logger.info("Failing node %s", node)
             
             # Isolate this node
-            for other_node in self.state.nodes:
-                if other_node != node and other_node in self.state.node_info:
-                    other_ip = self.state.node_info[other_node].ip
-                    WarnetRPC.set_ban(node, other_ip, "add")
+            other_ips = [ip for other, ip in self.state.ip_by_node.items() if other != node]
+            WarnetRPC.set_ban_many(node, other_ips, "add")
             
             self.failed_nodes.append(node)
             self.monitor.collector.collect_heights()
@@ -816,14 +1167,13 @@ class CascadeFailureTest(TestScenario):
         # Recovery phase
         logger.info("Starting recovery phase")
         for node in self.failed_nodes:
-            logger.info(f"Recovering node {node}")
+            logger.info("Recovering node %s", node)
             WarnetRPC.clear_banned(node)
             time.sleep(recovery_interval)
     
     def teardown(self):
         logger.info("Ensuring all nodes recovered")
-        for node in self.failed_nodes:
-            WarnetRPC.clear_banned(node)
+        # reconnect_all clears bans on every node, failed ones included
         self.partition.reconnect_all()
 
 
@@ -833,16 +1183,20 @@ class ConfigLoader:
     @staticmethod
     def load(config_file: str = "test_config.yaml") -> dict:
         """Load configuration from YAML file"""
+        # Imported here so using the framework as a library doesn't pay for yaml
+        import yaml
+        # libyaml-backed loader when PyYAML was built with it; same results as SafeLoader
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
         try:
             with open(config_file, 'r') as f:
-                config = yaml.safe_load(f)
-            logger.info(f"Loaded configuration from {config_file}")
+                config = yaml.load(f, Loader=loader)
+            logger.info("Loaded configuration from %s", config_file)
             return config
         except FileNotFoundError:
-            logger.error(f"Config file {config_file} not found")
+            logger.error("Config file %s not found", config_file)
             return {}
         except yaml.YAMLError as e:
-            logger.error(f"Error parsing config: {e}")
+            logger.error("Error parsing config: %s", e)
             return {}
     
     @staticmethod
@@ -850,6 +1204,15 @@ class ConfigLoader:
         """Get list of enabled test configurations"""
         test_suite = config.get('test_suite', [])
         return [test for test in test_suite if test.get('enabled', True)]
+    
+    @staticmethod
+    def validate(config: dict, known_types: set):
+        """Raise ValueError if an enabled test names an unknown test type"""
+        unknown = [f"{test.get('name')} ({test.get('type')})"
+                   for test in ConfigLoader.get_enabled_tests(config)
+                   if test.get('type') not in known_types]
+        if unknown:
+            raise ValueError(f"Unknown test type for: {', '.join(unknown)}")
 
 
 class TestOrchestrator:
@@ -868,9 +1231,25 @@ class TestOrchestrator:
     def __init__(self, nodes: List[str], config: dict = None):
         self.state = NetworkState(nodes)
         self.config = config or {}
+        # Node info is fixed after discovery, so its report form is built once
+        self._node_info_export = {name: {'ip': info.ip, 'version': info.version}
+                                  for name, info in self.state.node_info.items()}
+        
+        rpc_config = (self.config.get('network') or {}).get('rpc') or {}
+        if rpc_config.get('direct'):
+            # Credentials are never defaulted; keep them out of checked-in configs
+            user = rpc_config.get('user') or os.environ.get('WARNET_RPC_USER')
+            password = rpc_config.get('password') or os.environ.get('WARNET_RPC_PASSWORD')
+            if user and password:
+                WarnetRPC.use_direct_rpc(
+                    {node: info.ip for node, info in self.state.node_info.items()},
+                    user, password, port=rpc_config.get('port', 18443))
+            else:
+                logger.error("network.rpc.direct needs WARNET_RPC_USER and WARNET_RPC_PASSWORD "
+                             "(or rpc user/password in the config); using warnet CLI")
         self.test_results: List[TestResult] = []
-        self.report_dir = Path(config.get('reporting', {}).get('output_dir', 'test_reports'))
-        self.report_dir.mkdir(exist_ok=True)
+        # Created when the first report is saved
+        self.report_dir = Path((self.config.get('reporting') or {}).get('output_dir', 'test_reports'))
     
     def run_test(self, test_class, name: str, config: dict = None) -> TestResult:
         """Run a single test scenario"""
@@ -880,135 +1259,159 @@ class TestOrchestrator:
         
         # Stabilization period between tests
         logger.info("Waiting for network stabilization...")
-        time.sleep(60)
+        self._wait_for_stable()
         
         return result
     
+    def _wait_for_stable(self):
+        """Wait until every node reports the same tip, unchanged across two polls, or max_wait passes"""
+        settings = self.config.get('stabilization') or {}
+        max_wait = settings.get('max_wait', 60)
+        poll = settings.get('poll', 2.0)
+        
+        start = time.time()
+        deadline = start + max_wait
+        previous_tip = None
+        stable = False
+        while True:
+            tips = {tip_hash for _, tip_hash in self.state.get_chain_tips().values()}
+            # A failed RPC reports an empty hash, which must not count as agreement
+            tip = next(iter(tips)) if len(tips) == 1 else None
+            stable = bool(tip) and tip == previous_tip
+            previous_tip = tip
+            remaining = deadline - time.time()
+            if stable or remaining <= 0:
+                break
+            time.sleep(min(poll, remaining))
+        
+        elapsed = time.time() - start
+        if stable:
+            logger.info("Network stable after %.1fs", elapsed)
+        else:
+            logger.warning("Network not stable after %.1fs, continuing", elapsed)
+    
     def run_test_suite(self):
-        """Run complete test suite from config"""
-        logger.info("="*60)
-        logger.info("STARTING WARNET TEST SUITE")
-        logger.info("="*60)
+        """Run complete test suite from config; raises ValueError on unknown test types"""
+        # Reject the whole suite before any scenario has touched the network
+        ConfigLoader.validate(self.config, set(self.TEST_CLASSES))
+        
+        logger.info("%s\nSTARTING WARNET TEST SUITE\n%s", _BAR60, _BAR60)
         
         enabled_tests = ConfigLoader.get_enabled_tests(self.config)
-        logger.info(f"Running {len(enabled_tests)} tests")
+        logger.info("Running %s tests", len(enabled_tests))
         
         for test_config in enabled_tests:
             test_name = test_config.get('name')
             test_type = test_config.get('type')
             test_params = test_config.get('config', {})
             
-            test_class = self.TEST_CLASSES.get(test_type)
-            if not test_class:
-                logger.error(f"Unknown test type: {test_type}")
-                continue
-            
-            logger.info(f"\nRunning: {test_name} ({test_type})")
+            test_class = self.TEST_CLASSES[test_type]
+            logger.info("\nRunning: %s (%s)", test_name, test_type)
             self.run_test(test_class, test_name, test_params)
         
-        logger.info("="*60)
-        logger.info("TEST SUITE COMPLETE")
-        logger.info("="*60)
+        logger.info("%s\nTEST SUITE COMPLETE\n%s", _BAR60, _BAR60)
         
         return self.test_results
     
     def generate_report(self):
         """Generate comprehensive test report"""
-        print("\n" + "="*80)
-        print("WARNET TEST REPORT".center(80))
-        print("="*80)
-        print(f"\nGenerated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"Total Tests: {len(self.test_results)}")
-        print(f"Network: {len(self.state.nodes)} nodes")
-        print("-"*80)
+        now = datetime.now()
+        lines: List[str] = []
+        lines.append("\n" + _BAR80)
+        lines.append("WARNET TEST REPORT".center(80))
+        lines.append(_BAR80)
+        lines.append(f"\nGenerated: {now.strftime('%Y-%m-%d %H:%M:%S')}")
+        lines.append(f"Total Tests: {len(self.test_results)}")
+        lines.append(f"Network: {len(self.state.nodes)} nodes")
+        lines.append(_DASH80)
         
         for i, result in enumerate(self.test_results, 1):
-            print(f"\n{i}. {result.test_name}")
-            print(f"   Duration: {result.duration:.1f}s")
-            print(f"   Fork Detected: {'✓' if result.fork_detected else '✗'}")
+            lines.append(f"\n{i}. {result.test_name}")
+            lines.append(f"   Duration: {result.duration:.1f}s")
+            lines.append(f"   Fork Detected: {'✓' if result.fork_detected else '✗'}")
             
             if result.error:
-                print(f"   Error: {result.error}")
+                lines.append(f"   Error: {result.error}")
             else:
                 # Metrics summary
                 metrics = result.metrics
                 fork_point = metrics.get('fork_point')
                 if fork_point:
-                    print(f"   Fork Point: Block {fork_point}")
+                    lines.append(f"   Fork Point: Block {fork_point}")
                 
                 # Reorg analysis
-                reorg = metrics.get('reorg_analysis', {})
-                reorgs_occurred = sum(1 for data in reorg.values() if data.get('occurred'))
+                reorgs_occurred = metrics.get('reorgs_occurred_count', 0)
                 if reorgs_occurred > 0:
-                    print(f"   Reorgs: {reorgs_occurred} nodes")
+                    lines.append(f"   Reorgs: {reorgs_occurred} nodes")
                 
                 # Summary stats
                 stats = metrics.get('summary_stats', {})
                 if stats.get('fork_duration'):
-                    print(f"   Fork Duration: {stats['fork_duration']:.1f}s")
+                    lines.append(f"   Fork Duration: {stats['fork_duration']:.1f}s")
                 if stats.get('fork_count'):
-                    print(f"   Fork Events: {stats['fork_count']}")
+                    lines.append(f"   Fork Events: {stats['fork_count']}")
                 
                 # Height progression
-                height_prog = stats.get('height_progression', {})
-                if height_prog:
-                    total_blocks = sum(data['blocks_produced'] for data in height_prog.values())
-                    print(f"   Total Blocks Produced: {total_blocks}")
+                if stats.get('height_progression'):
+                    lines.append(f"   Total Blocks Produced: {metrics.get('total_blocks_produced', 0)}")
         
-        print("\n" + "="*80)
+        lines.append("\n" + _BAR80)
+        sys.stdout.write("\n".join(lines) + "\n")
         
         # Save detailed report to file
-        self._save_detailed_report()
+        self._save_detailed_report(now)
     
-    def _save_detailed_report(self):
-        """Save detailed JSON report"""
-        report_file = self.report_dir / f"test_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    def _result_to_dict(self, result: TestResult) -> Dict:
+        """Flatten a TestResult into its detailed report entry"""
+        return {
+            'name': result.test_name,
+            'start_time': result.start_time,
+            'end_time': result.end_time,
+            'duration': result.duration,
+            'fork_detected': result.fork_detected,
+            'error': result.error,
+            'metrics': result.metrics,
+            'pre_snapshot': {
+                'timestamp': result.pre_snapshot.timestamp,
+                'fork_detected': result.pre_snapshot.fork_detected,
+                'unique_tips': result.pre_snapshot.unique_tips,
+                'nodes': result.pre_snapshot.nodes
+            },
+            'post_snapshot': {
+                'timestamp': result.post_snapshot.timestamp,
+                'fork_detected': result.post_snapshot.fork_detected,
+                'unique_tips': result.post_snapshot.unique_tips,
+                'nodes': result.post_snapshot.nodes
+            }
+        }
+    
+    def _save_detailed_report(self, now: datetime):
+        """Save detailed JSON report stamped with the report time"""
+        self.report_dir.mkdir(exist_ok=True)
+        report_file = self.report_dir / f"test_report_{now.strftime('%Y%m%d_%H%M%S')}.json"
         
         report_data = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': now.isoformat(),
             'network': {
                 'nodes': self.state.nodes,
-                'node_info': {name: {'ip': info.ip, 'version': info.version} 
-                             for name, info in self.state.node_info.items()}
+                'node_info': self._node_info_export
             },
-            'tests': []
+            # Per-test dicts only reference the results' existing data
+            'tests': [self._result_to_dict(result) for result in self.test_results]
         }
         
-        for result in self.test_results:
-            test_data = {
-                'name': result.test_name,
-                'start_time': result.start_time,
-                'end_time': result.end_time,
-                'duration': result.duration,
-                'fork_detected': result.fork_detected,
-                'error': result.error,
-                'metrics': result.metrics,
-                'pre_snapshot': {
-                    'timestamp': result.pre_snapshot.timestamp,
-                    'fork_detected': result.pre_snapshot.fork_detected,
-                    'unique_tips': result.pre_snapshot.unique_tips,
-                    'nodes': result.pre_snapshot.nodes
-                },
-                'post_snapshot': {
-                    'timestamp': result.post_snapshot.timestamp,
-                    'fork_detected': result.post_snapshot.fork_detected,
-                    'unique_tips': result.post_snapshot.unique_tips,
-                    'nodes': result.post_snapshot.nodes
-                }
-            }
-            report_data['tests'].append(test_data)
+        # Readable by default; reporting.compact_json trades that for size
+        compact = (self.config.get('reporting') or {}).get('compact_json', False)
+        with open(report_file, 'wb') as f:
+            f.write(_json_dumps(report_data, compact))
         
-        with open(report_file, 'w') as f:
-            json.dump(report_data, f, indent=2)
-        
-        logger.info(f"Detailed report saved to {report_file}")
+        logger.info("Detailed report saved to %s (%.1f KiB)", report_file,
+                    report_file.stat().st_size / 1024)
 
 
 # Main execution
 def main():
     """Main entry point"""
-    import sys
-    
     # Load configuration
     config_file = sys.argv[1] if len(sys.argv) > 1 else "test_config.yaml"
     config = ConfigLoader.load(config_file)
@@ -1017,6 +1420,12 @@ def main():
         logger.error("Failed to load configuration. Using defaults.")
         config = {}
     
+    try:
+        ConfigLoader.validate(config, set(TestOrchestrator.TEST_CLASSES))
+    except ValueError as e:
+        logger.error("Invalid configuration: %s", e)
+        sys.exit(1)
+    
     # Get nodes from config or use defaults
     nodes = config.get('network', {}).get('nodes', [f"tank-{i:04d}" for i in range(8)])
     